@@ -1,24 +1,41 @@
 # saonix.py
 # Single-file: loader (GitHub update + cached downloads) + app (themes/glow/i18n/hotkeys/library/record)
-# Build without console: pyinstaller --noconsole --onefile --name Saonix saonix.py
+# Build without console: pyinstaller --noconsole --onefile --add-data "i18n;i18n" --name Saonix saonix.py
 
 import os
+import re
 import sys
+import atexit
 import json
 import time
 import ctypes
 import queue
+import collections
 import shutil
+import sqlite3
 import hashlib
+import array
+import base64
+import functools
 import zipfile
 import threading
 import traceback
 import locale as pylocale
+from fractions import Fraction
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextlib
+import http.client
+import urllib.parse
 import urllib.request
 import urllib.error
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Callable
 
+try:
+    import orjson  # optional: faster JSON for the macro DB and caches
+except ImportError:
+    orjson = None
+
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
 
@@ -32,6 +49,7 @@ from pynput.keyboard import Key, KeyCode, Controller as KeyboardController
 # ============================================================
 
 APP_NAME = "Saonix"
+APP_VERSION = "1.0"
 
 # Put a manifest.json in your GitHub repo, example format:
 # {
@@ -47,12 +65,19 @@ ICON_PNG_URL = "https://raw.githubusercontent.com/relberof/desktop-tutorial/69ce
 
 SUPPORT_DISCORD = "Relberof"
 
+# cached manifest/icon younger than this are used without touching the network;
+# older ones are still used, but refreshed in the background for the next start
+HTTP_CACHE_FRESH_SECONDS = 3600
+
 
 # ============================================================
 # Paths
 # ============================================================
 
+@functools.lru_cache(maxsize=64)
 def _ensure_dir(p: str) -> str:
+    # memoized: app dirs are never removed while running, so one makedirs per path is enough.
+    # Directories that do get deleted (update staging) must call os.makedirs directly.
     os.makedirs(p, exist_ok=True)
     return p
 
@@ -77,7 +102,13 @@ DIR_CACHE = _ensure_dir(os.path.join(ROOT, "cache"))
 DIR_LOGS = _ensure_dir(os.path.join(ROOT, "logs"))
 DIR_LOCALES = _ensure_dir(os.path.join(ROOT, "locales"))
 
-DB_FILE = os.path.join(DIR_DATA, "macros.json")
+# read-only files shipped with the app (PyInstaller unpacks --add-data into sys._MEIPASS)
+DIR_RESOURCES = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+DIR_BUILTIN_LOCALES = os.path.join(DIR_RESOURCES, "i18n")
+
+DB_FILE = os.path.join(DIR_DATA, "macros.sqlite")
+# pre-SQLite database; imported once into DB_FILE and then left in place
+LEGACY_DB_FILE = os.path.join(DIR_DATA, "macros.json")
 SETTINGS_FILE = os.path.join(DIR_DATA, "settings.json")
 LOCAL_VERSION_FILE = os.path.join(DIR_DATA, "local_version.json")
 LOG_FILE = os.path.join(DIR_LOGS, "saonix.log")
@@ -88,13 +119,25 @@ CACHED_MANIFEST_META = os.path.join(DIR_CACHE, "manifest_meta.json")
 CACHED_ICON_FILE = os.path.join(DIR_CACHE, "icon.png")
 CACHED_ICON_META = os.path.join(DIR_CACHE, "icon_meta.json")
 
+# merged i18n catalog of the last run, per language
+I18N_CACHE_FMT = os.path.join(DIR_CACHE, "i18n_{lang}.json")
+
 
 # ============================================================
 # Utils
 # ============================================================
 
+# (epoch second, formatted) -- swapped as one tuple so concurrent loggers never see a torn pair
+_ts_cache = (0, "")
+
 def _ts() -> str:
-    return time.strftime("%Y-%m-%d %H:%M:%S")
+    global _ts_cache
+    now = int(time.time())
+    sec, text = _ts_cache
+    if sec != now:
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _ts_cache = (now, text)
+    return text
 
 def _clamp(v, lo, hi):
     return max(lo, min(hi, v))
@@ -120,17 +163,38 @@ def _sha256_file(path: str) -> str:
 
 def _atomic_write_json(path: str, data: Any):
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     os.replace(tmp, path)
 
+def _set_text(w, text: str):
+    # cget is a cheap Tcl read; configure re-lays-out the widget even when nothing changed
+    if w is not None and w.cget("text") != text:
+        w.configure(text=text)
+
 def _read_json(path: str, default: Any):
     try:
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except Exception:
         return default
 
+def _json_dumps(data: Any):
+    # compact form for DB rows (bytes with orjson, str without; both read back by _json_loads)
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+def _json_loads(raw) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 
 # ============================================================
 # Logger
@@ -138,20 +202,53 @@ def _read_json(path: str, default: Any):
 
 class Logger:
     def __init__(self):
-        self._lock = threading.Lock()
         self._sink: Optional[Callable[[str], None]] = None
+        # producers only enqueue; a single writer thread owns the log file (None = stop)
+        self._q: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
 
     def set_sink(self, sink: Optional[Callable[[str], None]]):
         self._sink = sink
 
+    def _writer_loop(self):
+        # the writer owns one append handle for the whole run; reopened only after an error
+        f = None
+        try:
+            while True:
+                buf = [self._q.get()]
+                try:
+                    while True:
+                        buf.append(self._q.get_nowait())
+                except queue.Empty:
+                    pass
+                lines = [ln for ln in buf if ln is not None]
+                if lines:
+                    try:
+                        if f is None:
+                            f = open(LOG_FILE, "a", encoding="utf-8")
+                        f.write("\n".join(lines) + "\n")
+                        f.flush()
+                    except Exception:
+                        if f is not None:
+                            try: f.close()
+                            except Exception: pass
+                        f = None
+                if len(lines) != len(buf):
+                    return
+        finally:
+            if f is not None:
+                f.close()
+
+    def close(self):
+        """Flush queued lines and stop the writer thread."""
+        if self._writer.is_alive():
+            self._q.put(None)
+            self._writer.join(timeout=2.0)
+
     def _write(self, level: str, msg: str):
         line = f"[{_ts()}] [{level}] {msg}"
-        with self._lock:
-            try:
-                with open(LOG_FILE, "a", encoding="utf-8") as f:
-                    f.write(line + "\n")
-            except Exception:
-                pass
+        self._q.put(line)
         try:
             if self._sink:
                 self._sink(line + "\n")
@@ -163,6 +260,7 @@ class Logger:
     def error(self, msg: str): self._write("ERROR", msg)
 
 log = Logger()
+atexit.register(log.close)
 
 
 # ============================================================
@@ -193,6 +291,14 @@ def _system_lang_guess() -> str:
         pass
     return "en"
 
+class _Catalog(dict):
+    # a missing key translates to itself; hits never leave C (see I18N.load)
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> str:
+        return key
+
+
 class I18N:
     SUPPORTED = ["en", "ru"]
 
@@ -273,113 +379,135 @@ class I18N:
         "exported": "Exported",
     }
 
-    RU = {
-        "app_title": "Saonix",
-        "nav_record": "● Запись",
-        "nav_library": "📚 Библиотека",
-        "nav_settings": "⚙ Настройки",
-        "status_ready": "Готово",
-        "status_recording": "● Запись…",
-        "status_playing": "▶ Воспроизведение…",
-        "style": "Стиль",
-        "theme": "Тема",
-        "theme_dark": "Тёмная",
-        "theme_light": "Светлая",
-        "glow": "Glow",
-        "language": "Язык",
-        "support": "Поддержка",
-        "support_text": "Вопросы / проблемы / предложения:\nDiscord: Relberof",
-
-        "page_record": "Запись",
-        "page_library": "Библиотека",
-        "page_settings": "Настройки",
-
-        "rec_controls": "Управление",
-        "rec_start": "● Начать запись",
-        "rec_stop": "■ Остановить запись",
-        "rec_play_loaded": "▶ Запустить (загруженный)",
-        "rec_stop_play": "⏹ Остановить",
-        "rec_save_label": "Сохранить в библиотеку:",
-        "rec_save_btn": "💾 Сохранить",
-        "rec_clear_log": "Очистить лог (в окне)",
-        "rec_tips": "Подсказки",
-
-        "lib_title": "Библиотека",
-        "search_ph": "Поиск…",
-        "btn_load": "Загрузить",
-        "btn_delete": "Удалить",
-        "btn_rename": "Переименовать",
-        "btn_clone": "Клонировать",
-        "btn_export": "Экспорт JSON",
-        "btn_import": "Импорт JSON",
-        "bind": "Бинд:",
-        "bind_ph": "F6 или Ctrl+Alt+F6",
-        "bind_set": "Назначить",
-        "bind_remove": "Снять",
-        "play_selected": "▶ Запустить выбранный",
-
-        "settings_playback": "Воспроизведение",
-        "repeat": "Повтор (раз)",
-        "loop": "Цикл (сек, 0=выкл)",
-        "speed": "Скорость",
-        "delay": "Задержка старта (сек)",
-        "apply": "Применить",
-        "reset": "Сброс",
-        "base_hotkeys": "Базовые хоткеи",
-        "hk_rec": "Старт записи",
-        "hk_stoprec": "Стоп записи",
-        "hk_play": "Пуск загруженного",
-        "hk_stop": "Стоп воспроизведения",
-        "hk_apply": "Применить хоткеи",
-
-        "save_name_warn": "Введи имя макроса.",
-        "no_events_warn": "Нет событий. Сначала запиши макрос.",
-        "overwrite_q": "Макрос уже существует. Перезаписать?",
-        "select_macro_warn": "Выбери макрос.",
-        "delete_q": "Удалить макрос?",
-        "invalid_hotkey": "Неверный формат. Пример: F6 или Ctrl+Alt+F6",
-
-        "empty": "(пусто)",
-        "binds_none": "(биндов нет)",
-        "saved": "Сохранено",
-        "loaded": "Загружено",
-        "deleted": "Удалено",
-        "renamed": "Переименовано",
-        "cloned": "Клонировано",
-        "imported": "Импортировано",
-        "exported": "Экспортировано",
-    }
+    # identical values across languages ("Saonix", "Glow", ...) share one str object
+    for _k in EN:
+        EN[_k] = sys.intern(EN[_k])
+    del _k
+
+    # built-in catalogs with the English fallback already merged in; shared read-only.
+    # Each language is one flat dict and keys are interned, so every catalog shares the
+    # key objects of the literal call sites and a lookup is a single identity-hit probe.
+    # Only English lives in this module; other languages are read from i18n/<lang>.json whenever
+    # _LOADED has no entry for the file's current stamp.
+    _MERGED: Dict[str, Dict[str, str]] = {"en": EN}
+    # final catalogs built this process, by (lang, override file mtime, bundled file stamp);
+    # switching back to a language is a dict hit, no cache-file read
+    _LOADED: Dict[tuple, "_Catalog"] = {}
+    # sha1 of EN, so the on-disk cache notices edited English strings without a version bump
+    _EN_DIGEST: Optional[str] = None
+
+    # fixed attribute set: no per-instance __dict__; t is the loaded catalog's __getitem__
+    __slots__ = ("lang", "dict", "t", "_snapshots")
 
     def __init__(self, lang: str):
         self.lang = "en"
-        self.dict: Dict[str, str] = dict(self.EN)
+        self.dict: Dict[str, str] = self._MERGED["en"]
+        self._snapshots: Dict[tuple, Dict[str, str]] = {}
         self.load(lang)
 
-    def load(self, lang: str):
+    @classmethod
+    def resolve(cls, lang: str) -> str:
+        """Language code load() would use for a menu/settings value."""
         lang = (lang or "auto").strip().lower()
         if lang == "auto":
             lang = _system_lang_guess()
-        if lang not in self.SUPPORTED:
-            lang = "en"
-        base = dict(self.EN)
-        if lang == "ru":
-            base.update(self.RU)
+        return lang if lang in cls.SUPPORTED else "en"
+
+    def load(self, lang: str):
+        lang = self.resolve(lang)
 
         # optional external override file locales/<lang>.json
         ext_path = os.path.join(DIR_LOCALES, f"{lang}.json")
-        if os.path.exists(ext_path):
+        try:
+            ext_mtime = os.stat(ext_path).st_mtime_ns
+        except OSError:
+            ext_mtime = None
+
+        # bundled i18n/<lang>.json as (mtime_ns, size); None when it is missing
+        builtin_stamp = None
+        if lang != "en":
+            try:
+                st = os.stat(os.path.join(DIR_BUILTIN_LOCALES, f"{lang}.json"))
+                builtin_stamp = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+
+        key = (lang, ext_mtime, builtin_stamp)
+        cat = self._LOADED.get(key)
+        if cat is None:
+            cat = self._LOADED[key] = _Catalog(self._merge(lang, ext_path, ext_mtime, builtin_stamp))
+
+        self.lang = lang
+        self.dict = cat
+        self._snapshots = {}
+        # bound dict lookup: no Python frame per translation, __missing__ only for unknown keys
+        self.t = cat.__getitem__
+
+    @classmethod
+    def _merge(cls, lang: str, ext_path: str, ext_mtime: Optional[int],
+               builtin_stamp: Optional[tuple]) -> Dict[str, str]:
+        # English is already in memory, and a bundled catalog alone is one file read either
+        # way: the disk cache only saves work when an override has to be merged in
+        cacheable = lang != "en" and ext_mtime is not None
+        if cacheable:
+            # reuse last run's merged catalog while every input (app version, English strings,
+            # bundled catalog, override file) is unchanged
+            if cls._EN_DIGEST is None:
+                cls._EN_DIGEST = hashlib.sha1(json.dumps(cls.EN, sort_keys=True).encode("utf-8")).hexdigest()
+            stamp = {"ver": APP_VERSION, "en": cls._EN_DIGEST,
+                     "builtin": list(builtin_stamp) if builtin_stamp else None, "ext_mtime": ext_mtime}
+            cache_path = I18N_CACHE_FMT.format(lang=lang)
+            cached = _read_json(cache_path, None)
+            if (isinstance(cached, dict) and all(cached.get(k) == v for k, v in stamp.items())
+                    and isinstance(cached.get("strings"), dict)):
+                return {sys.intern(str(k)): sys.intern(str(v)) for k, v in cached["strings"].items()}
+        base = cls._builtin(lang)
+        if base is None:
+            # bundled catalog missing or unreadable: serve English, but never persist that
+            log.warn(f"Translation '{lang}' not found in {DIR_BUILTIN_LOCALES}; using English "
+                     f"(build with --add-data \"i18n;i18n\")")
+            return cls._with_override(cls.EN, ext_path, ext_mtime)
+        base = cls._with_override(base, ext_path, ext_mtime)
+        if cacheable:
+            try:
+                _atomic_write_json(cache_path, {**stamp, "lang": lang, "strings": base})
+            except Exception:
+                pass
+        return base
+
+    @staticmethod
+    def _with_override(base: Dict[str, str], ext_path: str, ext_mtime: Optional[int]) -> Dict[str, str]:
+        if ext_mtime is not None:
             try:
                 j = _read_json(ext_path, {})
                 if isinstance(j, dict):
-                    base.update({str(k): str(v) for k, v in j.items()})
+                    base = {**base, **{sys.intern(str(k)): str(v) for k, v in j.items()}}
             except Exception:
                 pass
+        return base
+
+    @classmethod
+    def _builtin(cls, lang: str) -> Optional[Dict[str, str]]:
+        # None when the bundled i18n/<lang>.json cannot be read. Not memoized here: the caller
+        # already is, per file stamp, so an edited file is picked up on the next load()
+        merged = cls._MERGED.get(lang)
+        if merged is not None:
+            return merged
+        j = _read_json(os.path.join(DIR_BUILTIN_LOCALES, f"{lang}.json"), None)
+        if not isinstance(j, dict):
+            return None
+        merged = dict(cls.EN)
+        merged.update({sys.intern(str(k)): sys.intern(str(v)) for k, v in j.items()})
+        return merged
 
-        self.lang = lang
-        self.dict = base
-
-    def t(self, key: str) -> str:
-        return self.dict.get(key, key)
+    def snapshot(self, keys: tuple) -> Dict[str, str]:
+        # resolved {key: text} for a fixed key set, cached until the next load()
+        snap = self._snapshots.get(keys)
+        if snap is None:
+            d = self.dict
+            snap = {k: d.get(k, k) for k in keys}
+            self._snapshots[keys] = snap
+        return snap
 
 
 # ============================================================
@@ -447,27 +575,226 @@ STYLES: Dict[str, StylePack] = {
 # DB
 # ============================================================
 
+# Stored macros keep events column-wise: {"t": [...], "device": [...], "type": [...], "data": [...]}.
+# Export files and older DBs use one {"t", "device", "type", "data"} dict per event.
+EVENT_FIELDS = ("t", "device", "type", "data")
+
+def _events_to_columns(events: Any) -> Dict[str, list]:
+    if isinstance(events, dict):
+        return {f: list(events.get(f, [])) for f in EVENT_FIELDS}
+    if events and not isinstance(events[0], dict):
+        # Event objects: read the slots straight into columns (no asdict deep copy)
+        return {f: [getattr(e, f) for e in events] for f in EVENT_FIELDS}
+    return {f: [e.get(f) for e in events] for f in EVENT_FIELDS}
+
+def _columns_to_events(cols: Dict[str, list]) -> List[dict]:
+    return [dict(zip(EVENT_FIELDS, row)) for row in zip(*(cols[f] for f in EVENT_FIELDS))]
+
+def _clone_macro(m: Dict[str, Any]) -> Dict[str, Any]:
+    # copying the columns is enough: stored event data is never mutated in place
+    return {
+        **m,
+        "created": int(time.time()),
+        "events": _events_to_columns(m.get("events", {})),
+        "settings": dict(m.get("settings", {})),
+    }
+
 class MacroDB:
-    def __init__(self, path: str):
+    # 2: events stored column-wise (see EVENT_FIELDS)
+    VERSION = 2
+    # mutations are coalesced into one write this long after the last change
+    SAVE_DELAY = 0.25
+    # WAL + NORMAL: a commit appends to the log instead of rewriting pages and fsyncing twice
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA temp_store=MEMORY",
+    )
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS macros (name TEXT PRIMARY KEY, created INTEGER, settings, events)",
+        "CREATE TABLE IF NOT EXISTS binds (hk TEXT PRIMARY KEY, macro TEXT)",
+        "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value)",
+    )
+
+    __slots__ = ("path", "legacy_path", "data", "_names_cache", "_names_lc", "_by_macro", "_lock",
+                 "_con", "_dirty", "_dirty_macros", "_dirty_binds", "_dirty_settings", "_copies",
+                 "_save_timer", "_revs", "_rev_seq")
+
+    def __init__(self, path: str, legacy_path: Optional[str] = None):
         self.path = path
-        self.data = {"version": 1, "macros": {}, "binds": {}, "settings": {}}
+        self.legacy_path = legacy_path
+        # in-memory mirror of the database; reads never touch SQLite
+        self.data = {"version": self.VERSION, "macros": {}, "binds": {}, "settings": {}}
+        # sorted macro names; None = stale, rebuilt on the next names() call
+        self._names_cache: Optional[List[str]] = None
+        # (names list it was built from, lowercased names); rebuilt when _names_cache is replaced
+        self._names_lc: Optional[tuple] = None
+        # reverse of data["binds"]: macro name -> hotkeys bound to it
+        self._by_macro: Dict[str, set] = {}
+        # guards data and the connection against the debounced save running on the timer thread
+        self._lock = threading.RLock()
+        self._con: Optional[sqlite3.Connection] = None
+        # what the next save writes: only changed macro rows, the binds table, the settings row
+        self._dirty = False
+        self._dirty_macros: set = set()
+        self._dirty_binds = False
+        self._dirty_settings = False
+        # clones not yet written: dst -> (src, src macro, dst macro); save() copies the row in
+        # SQL instead of re-serializing its events, as long as both entries are still those objects
+        self._copies: Dict[str, tuple] = {}
+        self._save_timer: Optional[threading.Timer] = None
+        # macro name -> stamp of its last change (see revision); one counter for all names, so
+        # a deleted and re-created name never repeats a stamp
+        self._revs: Dict[str, int] = {}
+        self._rev_seq = 0
         self.load()
+        atexit.register(self.flush)
+
+    def _connect(self) -> sqlite3.Connection:
+        # autocommit mode: save() opens its own BEGIN IMMEDIATE transaction
+        con = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        for pragma in self._PRAGMAS:
+            con.execute(pragma)
+        for ddl in self._SCHEMA:
+            con.execute(ddl)
+        return con
 
     def load(self):
-        if not os.path.exists(self.path):
+        with self._lock:
+            self._names_cache = None
+            fresh = not os.path.exists(self.path)
+            if self._con is not None:
+                self._con.close()
+            self._con = con = self._connect()
+            macros: Dict[str, Any] = {}
+            for name, created, settings, events in con.execute(
+                    "SELECT name, created, settings, events FROM macros"):
+                macros[name] = {"created": created, "events": _json_loads(events),
+                                "settings": _json_loads(settings)}
+            binds = dict(con.execute("SELECT hk, macro FROM binds"))
+            row = con.execute("SELECT value FROM kv WHERE key = 'settings'").fetchone()
+            self.data = {"version": self.VERSION, "macros": macros, "binds": binds,
+                         "settings": _json_loads(row[0]) if row else {}}
+            if fresh and self.legacy_path and os.path.exists(self.legacy_path):
+                self._import_legacy(self.legacy_path)
+            self._by_macro = {}
+            for hk, mn in self.data["binds"].items():
+                self._by_macro.setdefault(mn, set()).add(hk)
+
+    def _import_legacy(self, path: str):
+        d = _read_json(path, None)
+        if not isinstance(d, dict):
             return
-        d = _read_json(self.path, None)
-        if isinstance(d, dict):
-            self.data.update(d)
-            self.data.setdefault("macros", {})
-            self.data.setdefault("binds", {})
-            self.data.setdefault("settings", {})
+        macros = d.get("macros") or {}
+        if d.get("version", 1) < 2:
+            for m in macros.values():
+                m["events"] = _events_to_columns(m.get("events", []))
+        self.data["macros"] = macros
+        self.data["binds"] = dict(d.get("binds") or {})
+        self.data["settings"] = dict(d.get("settings") or {})
+        self._dirty_macros.update(macros)
+        self._dirty_binds = self._dirty_settings = self._dirty = True
+        self.save()
+        log.info(f"Imported {len(macros)} macros from {os.path.basename(path)}")
 
     def save(self):
-        _atomic_write_json(self.path, self.data)
+        """Write pending changes now, cancelling any pending debounced save."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            data = self.data
+            macros = data["macros"]
+            con = self._con
+            write = set(self._dirty_macros)
+            copies = []
+            for dst, (src, src_m, m) in self._copies.items():
+                if dst in write or macros.get(dst) is not m:
+                    continue  # replaced or removed since; the dirty set covers it
+                if macros.get(src) is src_m:
+                    copies.append((dst, m["created"], src))
+                else:
+                    write.add(dst)  # source changed: store the clone itself
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                for name in write:
+                    m = macros.get(name)
+                    if m is None:
+                        con.execute("DELETE FROM macros WHERE name = ?", (name,))
+                    else:
+                        con.execute("INSERT OR REPLACE INTO macros VALUES (?, ?, ?, ?)",
+                                    (name, m.get("created", 0), _json_dumps(m.get("settings", {})),
+                                     _json_dumps(m["events"])))
+                # after the writes above the source row matches its in-memory macro
+                if copies:
+                    con.executemany("INSERT OR REPLACE INTO macros (name, created, settings, events) "
+                                    "SELECT ?, ?, settings, events FROM macros WHERE name = ?", copies)
+                if self._dirty_binds:
+                    con.execute("DELETE FROM binds")
+                    con.executemany("INSERT INTO binds VALUES (?, ?)", data["binds"].items())
+                if self._dirty_settings:
+                    con.execute("INSERT OR REPLACE INTO kv VALUES ('settings', ?)",
+                                (_json_dumps(data["settings"]),))
+                con.execute("COMMIT")
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+            self._dirty_macros.clear()
+            self._copies.clear()
+            self._dirty_binds = self._dirty_settings = self._dirty = False
+
+    def flush(self):
+        """Write pending changes, if any."""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def _flush_from_timer(self):
+        try:
+            self.flush()
+        except Exception as e:
+            log.error(f"DB save error: {e}")
+
+    def _bump(self, names):
+        self._rev_seq += 1
+        for n in names:
+            self._revs[n] = self._rev_seq
+
+    def revision(self, name: str) -> int:
+        """Changes whenever the macro is written, renamed, deleted or re-created."""
+        return self._revs.get(name, 0)
+
+    def _mark_dirty(self, macros=(), binds: bool = False, settings: bool = False):
+        with self._lock:
+            if macros:
+                self._bump(macros)
+            self._dirty_macros.update(macros)
+            self._dirty_binds |= binds
+            self._dirty_settings |= settings
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._flush_from_timer)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def names(self) -> List[str]:
-        return sorted(self.data["macros"].keys(), key=lambda x: x.lower())
+        # shared cached list: callers must not mutate it
+        if self._names_cache is None:
+            self._names_cache = sorted(self.data["macros"], key=str.lower)
+        return self._names_cache
+
+    def search(self, q: str) -> List[str]:
+        """Names containing q (already lowercased), in names() order; read-only like names()."""
+        names = self.names()
+        if not q:
+            return names
+        lc = self._names_lc
+        if lc is None or lc[0] is not names:
+            lc = self._names_lc = (names, [n.lower() for n in names])
+        return [n for n, nl in zip(names, lc[1]) if q in nl]
 
     def exists(self, name: str) -> bool:
         return name in self.data["macros"]
@@ -475,118 +802,146 @@ class MacroDB:
     def get(self, name: str):
         return self.data["macros"].get(name)
 
-    def put(self, name: str, events: List[dict], settings: Dict[str, Any]):
-        self.data["macros"][name] = {
-            "created": int(time.time()),
-            "events": events,
-            "settings": settings
-        }
-        self.save()
+    def put(self, name: str, events: Any, settings: Dict[str, Any]):
+        """Store a macro; events may be a list of Events, event dicts, or a columns dict."""
+        with self._lock:
+            if name not in self.data["macros"]:
+                self._names_cache = None
+            self.data["macros"][name] = {
+                "created": int(time.time()),
+                "events": _events_to_columns(events),
+                "settings": settings
+            }
+            self._mark_dirty((name,))
+
+    def event_count(self, name: str) -> int:
+        m = self.data["macros"].get(name)
+        return len(m["events"]["t"]) if m else 0
+
+    def event_rows(self, name: str):
+        """(t, device, type, data) tuples of a macro, in recording order."""
+        m = self.data["macros"].get(name)
+        if not m:
+            return iter(())
+        cols = m["events"]
+        return zip(*(cols[f] for f in EVENT_FIELDS))
+
+    def get_events(self, name: str) -> List[dict]:
+        """Events of a macro as a list of dicts (export format)."""
+        m = self.data["macros"].get(name)
+        return _columns_to_events(m["events"]) if m else []
 
     def delete(self, name: str):
-        if name in self.data["macros"]:
-            del self.data["macros"][name]
-        dead = [hk for hk, mn in self.data["binds"].items() if mn == name]
-        for hk in dead:
-            del self.data["binds"][hk]
-        self.save()
+        with self._lock:
+            if name in self.data["macros"]:
+                del self.data["macros"][name]
+                self._names_cache = None
+            hks = self._by_macro.pop(name, ())
+            for hk in hks:
+                del self.data["binds"][hk]
+            self._mark_dirty((name,), binds=bool(hks))
 
     def rename(self, old: str, new: str) -> bool:
-        if old not in self.data["macros"]:
-            return False
-        if new in self.data["macros"]:
-            return False
-        self.data["macros"][new] = self.data["macros"].pop(old)
-        for hk, mn in list(self.data["binds"].items()):
-            if mn == old:
-                self.data["binds"][hk] = new
-        self.save()
-        return True
+        with self._lock:
+            if old not in self.data["macros"]:
+                return False
+            if new in self.data["macros"]:
+                return False
+            self.data["macros"][new] = self.data["macros"].pop(old)
+            self._names_cache = None
+            hks = self._by_macro.pop(old, None)
+            if hks:
+                for hk in hks:
+                    self.data["binds"][hk] = new
+                self._by_macro.setdefault(new, set()).update(hks)
+            self._mark_dirty((old, new), binds=bool(hks))
+            return True
 
     def clone(self, src: str, dst: str) -> bool:
-        if src not in self.data["macros"] or dst in self.data["macros"]:
-            return False
-        self.data["macros"][dst] = json.loads(json.dumps(self.data["macros"][src]))
-        self.data["macros"][dst]["created"] = int(time.time())
-        self.save()
-        return True
+        with self._lock:
+            if src not in self.data["macros"] or dst in self.data["macros"]:
+                return False
+            src_m = self.data["macros"][src]
+            m = self.data["macros"][dst] = _clone_macro(src_m)
+            self._names_cache = None
+            self._copies[dst] = (src, src_m, m)
+            self._bump((dst,))
+            self._mark_dirty()
+            return True
 
     def binds(self) -> Dict[str, str]:
         return dict(self.data.get("binds", {}))
 
     def set_bind(self, hk: str, macro: str):
-        self.data.setdefault("binds", {})
-        self.data["binds"][hk] = macro
-        self.save()
+        with self._lock:
+            prev = self.data["binds"].get(hk)
+            if prev is not None:
+                self._by_macro.get(prev, set()).discard(hk)
+            self.data["binds"][hk] = macro
+            self._by_macro.setdefault(macro, set()).add(hk)
+            self._mark_dirty(binds=True)
 
     def remove_bind(self, hk: str):
-        if hk in self.data.get("binds", {}):
-            del self.data["binds"][hk]
-            self.save()
+        with self._lock:
+            mn = self.data["binds"].pop(hk, None)
+            if mn is not None:
+                self._by_macro.get(mn, set()).discard(hk)
+                self._mark_dirty(binds=True)
 
     def get_settings(self) -> Dict[str, Any]:
         return dict(self.data.get("settings", {}))
 
     def set_settings(self, s: Dict[str, Any]):
-        self.data["settings"] = dict(s)
-        self.save()
+        with self._lock:
+            self.data["settings"] = dict(s)
+            self._mark_dirty(settings=True)
 
 
 # ============================================================
 # Hotkey parsing
 # ============================================================
 
+_HK_MODS = {
+    "ctrl": "<ctrl>", "control": "<ctrl>",
+    "alt": "<alt>",
+    "shift": "<shift>",
+    "win": "<cmd>", "windows": "<cmd>", "cmd": "<cmd>", "meta": "<cmd>",
+}
+_HK_SPECIAL = {"space": "<space>", "spc": "<space>", "tab": "<tab>", "esc": "<esc>", "escape": "<esc>"}
+
+# every accepted key token -> its pynput form; classifying a key is one hash lookup
+_HK_KEYS: Dict[str, str] = {c: c for c in "abcdefghijklmnopqrstuvwxyz0123456789"}
+_HK_KEYS.update({f"f{n}": f"<f{n}>" for n in range(1, 25)})
+_HK_KEYS.update(_HK_SPECIAL)
+
+# pure function of the entry text; the settings page re-normalizes the same handful of strings
+@functools.lru_cache(maxsize=256)
 def normalize_hotkey(text: str) -> Optional[str]:
     if not text:
         return None
-    t = str(text).strip().lower().replace(" ", "")
-    if not t:
-        return None
-    t = t.replace("<", "").replace(">", "")
-
-    if t.startswith("f") and t[1:].isdigit():
-        n = int(t[1:])
-        if 1 <= n <= 24:
-            return f"<f{n}>"
+    t = str(text).strip().lower().replace(" ", "").replace("<", "").replace(">", "")
 
-    parts = t.split("+")
+    # modifiers may come in any order ("F6+Ctrl"); the last other token is the key
     mods: List[str] = []
     key = None
-    for p in parts:
-        if p in ("ctrl", "control"):
-            mods.append("<ctrl>")
-        elif p == "alt":
-            mods.append("<alt>")
-        elif p == "shift":
-            mods.append("<shift>")
-        elif p in ("win", "windows", "cmd", "meta"):
-            mods.append("<cmd>")
+    for p in t.split("+"):
+        mod = _HK_MODS.get(p)
+        if mod is not None:
+            mods.append(mod)
         else:
             key = p
-
     if key is None:
         return None
 
-    if key.startswith("f") and key[1:].isdigit():
-        n = int(key[1:])
-        if 1 <= n <= 24:
-            key_fmt = f"<f{n}>"
-        else:
-            return None
-    elif len(key) == 1 and key.isdigit():
-        key_fmt = key
-    elif len(key) == 1 and ("a" <= key <= "z"):
-        key_fmt = key
-    elif key in ("space", "spc"):
-        key_fmt = "<space>"
-    elif key == "tab":
-        key_fmt = "<tab>"
-    elif key in ("esc", "escape"):
-        key_fmt = "<esc>"
-    else:
+    key_fmt = _HK_KEYS.get(key)
+    if key_fmt is None and key[:1] == "f" and key[1:].isdigit() and 1 <= int(key[1:]) <= 24:
+        # zero-padded forms like "f006"
+        key_fmt = f"<f{int(key[1:])}>"
+    if key_fmt is None:
         return None
 
-    return "+".join(mods + [key_fmt])
+    mods.append(key_fmt)
+    return "+".join(mods)
 
 
 # ============================================================
@@ -595,29 +950,169 @@ def normalize_hotkey(text: str) -> Optional[str]:
 
 @dataclass
 class Event:
+    # long recordings hold 100k+ of these: no per-instance __dict__
+    __slots__ = ("t", "device", "type", "data")
+
     t: float
     device: str
     type: str
     data: Dict[str, Any]
 
+# compact event kinds used by the playback columns
+_K_MOVE, _K_CLICK, _K_SCROLL, _K_PRESS, _K_RELEASE = range(5)
+_EVENT_KINDS = {
+    ("mouse", "move"): _K_MOVE,
+    ("mouse", "click"): _K_CLICK,
+    ("mouse", "scroll"): _K_SCROLL,
+    ("keyboard", "press"): _K_PRESS,
+    ("keyboard", "release"): _K_RELEASE,
+}
+# kind code -> (device, type, data field names of the positional payload); see _EVENT_KINDS
+_EVENT_SCHEMA = (
+    ("mouse", "move", ("x", "y")),
+    ("mouse", "click", ("x", "y", "button", "pressed")),
+    ("mouse", "scroll", ("x", "y", "dx", "dy")),
+    ("keyboard", "press", ("key",)),
+    ("keyboard", "release", ("key",)),
+)
+
+# name -> enum member; __members__ keeps platform aliases that plain iteration would skip
+_BUTTONS: Dict[str, Any] = dict(Button.__members__)
+_SPECIAL_KEYS: Dict[str, Any] = dict(Key.__members__)
+_MODIFIER_KEYS = (Key.ctrl_l, Key.ctrl_r, Key.alt_l, Key.alt_r,
+                  Key.shift_l, Key.shift_r, Key.cmd, Key.cmd_r)
+
+# Windows ticks timers at ~15.6ms by default; ask for 1ms while anything is playing.
+# Reference-counted so overlapping playbacks don't end the period early.
+_timer_res_lock = threading.Lock()
+_timer_res_users = 0
+
+def _timer_res_acquire():
+    global _timer_res_users
+    with _timer_res_lock:
+        _timer_res_users += 1
+        if _timer_res_users == 1:
+            try:
+                ctypes.windll.winmm.timeBeginPeriod(1)
+            except Exception:
+                pass
+
+def _timer_res_release():
+    global _timer_res_users
+    with _timer_res_lock:
+        _timer_res_users -= 1
+        if _timer_res_users == 0:
+            try:
+                ctypes.windll.winmm.timeEndPeriod(1)
+            except Exception:
+                pass
+
+class _KernelTimer:
+    """
+    Windows high-resolution waitable timer plus a manual-reset stop event. The playback
+    thread blocks on both in one WaitForMultipleObjects call, so the kernel wakes it at
+    the deadline or immediately on stop, independent of GIL/Tk load. One per engine,
+    kept for the process lifetime.
+    """
+    CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x2
+    TIMER_ALL_ACCESS = 0x1F0003
+    INFINITE = 0xFFFFFFFF
+
+    def __init__(self):
+        from ctypes import wintypes
+        k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        k32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+        k32.CreateWaitableTimerExW.argtypes = (ctypes.c_void_p, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD)
+        k32.SetWaitableTimer.restype = wintypes.BOOL
+        k32.SetWaitableTimer.argtypes = (wintypes.HANDLE, ctypes.POINTER(ctypes.c_longlong), wintypes.LONG,
+                                         ctypes.c_void_p, ctypes.c_void_p, wintypes.BOOL)
+        k32.CreateEventW.restype = wintypes.HANDLE
+        k32.CreateEventW.argtypes = (ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR)
+        k32.WaitForMultipleObjects.restype = wintypes.DWORD
+        k32.WaitForMultipleObjects.argtypes = (wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD)
+        for fn in (k32.SetEvent, k32.ResetEvent, k32.CloseHandle):
+            fn.restype = wintypes.BOOL
+            fn.argtypes = (wintypes.HANDLE,)
+
+        # high-resolution timers need Windows 10 1803+; older systems fail here and fall back
+        timer = k32.CreateWaitableTimerExW(None, None, self.CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, self.TIMER_ALL_ACCESS)
+        if not timer:
+            raise ctypes.WinError(ctypes.get_last_error())
+        stop = k32.CreateEventW(None, True, False, None)
+        if not stop:
+            k32.CloseHandle(timer)
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._k32 = k32
+        self._timer = timer
+        self._stop = stop
+        self._handles = (wintypes.HANDLE * 2)(timer, stop)
+
+    def wait(self, seconds: float) -> bool:
+        """Sleep up to `seconds`; True if set() was called (same contract as threading.Event.wait)."""
+        due = ctypes.c_longlong(-max(1, int(seconds * 10_000_000)))  # relative, 100ns units
+        if not self._k32.SetWaitableTimer(self._timer, ctypes.byref(due), 0, None, None, False):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return self._k32.WaitForMultipleObjects(2, self._handles, False, self.INFINITE) == 1
+
+    def set(self):
+        self._k32.SetEvent(self._stop)
+
+    def clear(self):
+        self._k32.ResetEvent(self._stop)
+
+def _make_kernel_timer() -> Optional[_KernelTimer]:
+    # elsewhere threading.Event.wait is already a precise condvar timed wait
+    try:
+        return _KernelTimer()
+    except Exception:
+        return None
+
 class MacroEngine:
     def __init__(self, logger: Logger):
         self.log = logger
         self.events: List[Event] = []
+        # hook threads append (t, kind, payload) tuples here; stop_recording turns them into events
+        self._rec_q: "collections.deque[tuple]" = collections.deque()
+        # (events list, its playback columns) from the last recording or _compile; reused while
+        # that list is still self.events, so replaying a loaded macro decodes its keys only once
+        self._play_cols: Optional[tuple] = None
         self.recording = False
         self.playing = False
+        # called with "recording" / "playing" / "ready" on every transition, possibly from
+        # a listener or playback thread -- the UI must marshal it onto its own loop
+        self.on_state_change: Optional[Callable[[str], None]] = None
 
-        self._t0: Optional[float] = None
+        # engine clock is integer nanoseconds (perf_counter_ns); Event.t stays float seconds
+        self._t0: Optional[int] = None
         self._stop_play = threading.Event()
+        # plain mirror of _stop_play for the per-event checks (no lock); the Event is only
+        # needed to interrupt sleeps
+        self._stop_flag = False
+        # kernel-timed, stop-interruptible sleeps for playback (Windows); None -> _stop_play.wait
+        self._ktimer = _make_kernel_timer()
         self._play_lock = threading.Lock()
 
         self.mouse_ctl = MouseController()
         self.kb_ctl = KeyboardController()
 
-        self._last_move = None
-        self._last_move_time = 0.0
-        self._min_move_interval = 0.01
+        # the hook keeps at most one move per interval; everything else is filtered at stop
+        self._last_move_time = 0
+        self._min_move_interval = 10_000_000
+        # moves closer than this (pixels, L-inf) to the last kept one are dropped at stop;
+        # raise it for smaller files, lower it for more faithful paths
+        self._move_px_threshold = 2
+        # a straight run of moves is folded into one segment only while it stays this short;
+        # playback holds the cursor at the segment start until the end point is due
+        self._move_fold_max_ns = 30_000_000
+        self._move_fold_max_px = 24
+
+        # system-wide input hooks exist only while recording (see _start_listeners)
+        self._mouse_listener = None
+        self._kb_listener = None
+        self.log.info("Engine ready.")
 
+    def _start_listeners(self):
+        # pynput listeners are one-shot threads: build fresh ones for every take
         self._mouse_listener = mouse.Listener(
             on_move=self._on_move,
             on_click=self._on_click,
@@ -628,27 +1123,42 @@ class MacroEngine:
             on_release=self._on_release,
             suppress=False
         )
-
         self._mouse_listener.start()
         self._kb_listener.start()
-        self.log.info("Engine ready.")
+
+    def _stop_listeners(self):
+        ml, kl = self._mouse_listener, self._kb_listener
+        self._mouse_listener = self._kb_listener = None
+        if ml is not None:
+            try: ml.stop()
+            except Exception: pass
+        if kl is not None:
+            try: kl.stop()
+            except Exception: pass
 
     def shutdown(self):
-        try: self._mouse_listener.stop()
-        except Exception: pass
-        try: self._kb_listener.stop()
-        except Exception: pass
+        self._stop_listeners()
+
+    def _notify(self, state: str):
+        cb = self.on_state_change
+        if cb is None:
+            return
+        try:
+            cb(state)
+        except Exception:
+            # the UI may already be gone (shutdown from a worker thread)
+            pass
 
-    def now(self) -> float:
-        return time.perf_counter()
+    def now(self) -> int:
+        return time.perf_counter_ns()
 
     def rel_time(self) -> float:
-        return 0.0 if self._t0 is None else self.now() - self._t0
+        return 0.0 if self._t0 is None else (self.now() - self._t0) / 1e9
 
-    def _add(self, device: str, etype: str, data: Dict[str, Any]):
+    def _add(self, kind: int, payload: tuple):
         if not self.recording:
             return
-        self.events.append(Event(t=self.rel_time(), device=device, type=etype, data=data))
+        self._rec_q.append((self.now(), kind, payload))
 
     def start_recording(self):
         with self._play_lock:
@@ -660,30 +1170,101 @@ class MacroEngine:
             # Release any stuck modifiers before starting
             self.release_all_modifiers()
             self.events = []
+            self._rec_q.clear()
+            self._last_move_time = 0
+            self._start_listeners()
             self._t0 = self.now()
             self.recording = True
             self.log.info("=== Recording started ===")
+        self._notify("recording")
 
     def stop_recording(self):
         if not self.recording:
             return
         self.recording = False
+        self._stop_listeners()
+        # one pass builds both the saved form (Event dicts) and the playback columns; the
+        # columns keep the listener's own key/button objects, so record -> play skips the
+        # repr round trip. Mouse moves are decimated here rather than in the hook.
+        q = self._rec_q
+        t0 = self._t0
+        px = self._move_px_threshold
+        fold_ns = self._move_fold_max_ns
+        fold_px = self._move_fold_max_px
+        events = []
+        ts = array.array("q")
+        kinds = bytearray()
+        payloads: List[tuple] = []
+        last = anchor = None  # last kept move position / start of its straight run
+        last_t = anchor_t = 0
+        # a take repeats a handful of keys: build each repr once and share it (read-only)
+        key_reprs: Dict[Any, Optional[dict]] = {}
+        for _ in range(len(q)):
+            t, kind, payload = q.popleft()
+            t -= t0
+            device, etype, fields = _EVENT_SCHEMA[kind]
+            if kind == _K_MOVE:
+                if last is not None:
+                    if max(abs(payload[0] - last[0]), abs(payload[1] - last[1])) < px:
+                        continue
+                    # collinear continuation of the previous move: slide its end point,
+                    # as long as the folded segment stays short in time and distance
+                    if (anchor is not None and kinds and kinds[-1] == _K_MOVE
+                            and t - anchor_t <= fold_ns
+                            and max(abs(payload[0] - anchor[0]), abs(payload[1] - anchor[1])) <= fold_px):
+                        ax, ay = last[0] - anchor[0], last[1] - anchor[1]
+                        bx, by = payload[0] - last[0], payload[1] - last[1]
+                        if ax * by == ay * bx and ax * bx + ay * by > 0:
+                            last, last_t = payload, t
+                            events[-1] = Event(t / 1e9, device, etype, dict(zip(fields, payload)))
+                            ts[-1] = t
+                            payloads[-1] = payload
+                            continue
+                anchor, last = last, payload
+                anchor_t, last_t = last_t, t
+            if kind >= _K_PRESS:
+                key = payload[0]
+                try:
+                    rep = key_reprs[key]
+                except KeyError:
+                    rep = key_reprs[key] = self._key_to_repr(key)
+                except TypeError:
+                    rep = self._key_to_repr(key)
+                if rep is None:
+                    continue
+                data = {"key": rep}
+            elif kind == _K_CLICK:
+                btn = payload[2]
+                data = {"x": payload[0], "y": payload[1],
+                        "button": btn.name if hasattr(btn, "name") else str(btn), "pressed": payload[3]}
+            else:
+                data = dict(zip(fields, payload))
+            events.append(Event(t / 1e9, device, etype, data))
+            ts.append(t)
+            kinds.append(kind)
+            payloads.append(payload)
+        self.events = events
+        self._play_cols = (events, (ts, bytes(kinds), payloads))
         self.release_all_modifiers()
         self.log.info(f"=== Recording stopped. Events: {len(self.events)} ===")
+        self._notify("ready")
 
     def stop_playing(self):
         with self._play_lock:
             if not self.playing:
                 return
+            self._stop_flag = True
             self._stop_play.set()
+            if self._ktimer is not None:
+                self._ktimer.set()
             self.playing = False
             self.release_all_modifiers()
             self.log.info("=== Stopped ===")
+        self._notify("ready")
 
     def release_all_modifiers(self):
         """Принудительно отпускает все клавиши-модификаторы (Win, Ctrl, Alt, Shift)."""
-        for key in [Key.ctrl_l, Key.ctrl_r, Key.alt_l, Key.alt_r,
-                    Key.shift_l, Key.shift_r, Key.cmd, Key.cmd_r]:
+        for key in _MODIFIER_KEYS:
             try:
                 self.kb_ctl.release(key)
             except Exception:
@@ -703,7 +1284,7 @@ class MacroEngine:
             kind = r.get("kind")
             val = r.get("value")
             if kind == "special":
-                return getattr(Key, val)
+                return _SPECIAL_KEYS.get(val)
             if kind == "char":
                 return val
             if kind == "vk":
@@ -713,70 +1294,94 @@ class MacroEngine:
         return None
 
     def _on_move(self, x, y):
-        if self.playing:
+        if not self.recording:
             return
         now = self.now()
-        pos = (int(x), int(y))
-        if pos == self._last_move:
-            return
         if now - self._last_move_time < self._min_move_interval:
             return
-        self._last_move = pos
         self._last_move_time = now
-        self._add("mouse", "move", {"x": pos[0], "y": pos[1]})
+        self._rec_q.append((now, _K_MOVE, (int(x), int(y))))
 
     def _on_click(self, x, y, button, pressed):
-        if self.playing:
-            return
-        self._add("mouse", "click", {
-            "x": int(x), "y": int(y),
-            "button": button.name if hasattr(button, "name") else str(button),
-            "pressed": bool(pressed)
-        })
+        self._add(_K_CLICK, (int(x), int(y), button, bool(pressed)))
 
     def _on_scroll(self, x, y, dx, dy):
-        if self.playing:
-            return
-        self._add("mouse", "scroll", {"x": int(x), "y": int(y), "dx": int(dx), "dy": int(dy)})
+        self._add(_K_SCROLL, (int(x), int(y), int(dx), int(dy)))
 
     def _on_press(self, key):
-        if self.playing:
-            return
-        rep = self._key_to_repr(key)
-        if rep:
-            self._add("keyboard", "press", {"key": rep})
+        self._add(_K_PRESS, (key,))
 
     def _on_release(self, key):
-        if self.playing:
-            return
-        rep = self._key_to_repr(key)
-        if rep:
-            self._add("keyboard", "release", {"key": rep})
-
-    def _apply_event(self, e: Event):
-        if e.device == "mouse":
-            if e.type == "move":
-                self.mouse_ctl.position = (e.data["x"], e.data["y"])
-            elif e.type == "click":
-                self.mouse_ctl.position = (e.data["x"], e.data["y"])
-                btn = getattr(Button, e.data.get("button", "left"), Button.left)
-                if e.data.get("pressed"):
-                    self.mouse_ctl.press(btn)
-                else:
-                    self.mouse_ctl.release(btn)
-            elif e.type == "scroll":
-                self.mouse_ctl.position = (e.data["x"], e.data["y"])
-                self.mouse_ctl.scroll(e.data["dx"], e.data["dy"])
-            return
+        self._add(_K_RELEASE, (key,))
+
+    def _compile(self, events: List[Event]):
+        """Events -> parallel columns (times, kind codes, positional payloads) for play_once."""
+        ts = array.array("q")  # ns offsets
+        kinds = bytearray()
+        payloads: List[tuple] = []
+        # (kind, value) -> decoded key; each distinct key is parsed once per macro
+        keys: Dict[tuple, Any] = {}
+        for e in events:
+            kind = _EVENT_KINDS.get((e.device, e.type))
+            if kind is None:
+                continue
+            d = e.data
+            if kind == _K_MOVE:
+                p = (d["x"], d["y"])
+            elif kind == _K_CLICK:
+                p = (d["x"], d["y"], _BUTTONS.get(d.get("button", "left"), Button.left), bool(d.get("pressed")))
+            elif kind == _K_SCROLL:
+                p = (d["x"], d["y"], d["dx"], d["dy"])
+            else:
+                r = d.get("key", {})
+                ck = (r.get("kind"), r.get("value")) if isinstance(r, dict) else None
+                try:
+                    key_obj = keys[ck]
+                except KeyError:
+                    key_obj = keys[ck] = self._repr_to_key(r)
+                except TypeError:
+                    key_obj = self._repr_to_key(r)
+                if key_obj is None:
+                    continue
+                p = (key_obj,)
+            ts.append(round(e.t * 1e9))
+            kinds.append(kind)
+            payloads.append(p)
+        return ts, bytes(kinds), payloads
+
+    def _make_dispatch(self) -> tuple:
+        """
+        Playback handlers in _K_* order; each takes its event's payload tuple unpacked.
+        Built per play() so controller methods and the position property are closure
+        locals instead of attribute lookups on every event.
+        """
+        mctl = self.mouse_ctl
+        pos_prop = type(mctl).position
+        get_pos = functools.partial(pos_prop.fget, mctl)
+        set_pos = functools.partial(pos_prop.fset, mctl)
+        mpress, mrelease, mscroll = mctl.press, mctl.release, mctl.scroll
+
+        def move(x, y):
+            set_pos((x, y))
+
+        # clicks/scrolls usually follow a move to the same spot: reading the cursor is cheap,
+        # injecting a redundant reposition is not
+        def click(x, y, btn, pressed):
+            pos = (x, y)
+            if get_pos() != pos:
+                set_pos(pos)
+            if pressed:
+                mpress(btn)
+            else:
+                mrelease(btn)
 
-        if e.device == "keyboard":
-            key_obj = self._repr_to_key(e.data.get("key", {}))
-            if key_obj is None:
-                return
-            if e.type == "press":
-                self.kb_ctl.press(key_obj)
-            elif e.type == "release":
-                self.kb_ctl.release(key_obj)
+        def scroll(x, y, dx, dy):
+            pos = (x, y)
+            if get_pos() != pos:
+                set_pos(pos)
+            mscroll(dx, dy)
+
+        return (move, click, scroll, self.kb_ctl.press, self.kb_ctl.release)
 
     def play(self, repeat: int, loop_seconds: int, speed: float, start_delay: float):
         with self._play_lock:
@@ -790,50 +1395,94 @@ class MacroEngine:
                 return
 
             self.playing = True
+            self._stop_flag = False
             self._stop_play.clear()
-
-            def play_once():
-                base = self.now()
-                sp = max(speed, 0.05)
-                for ev in self.events:
-                    if self._stop_play.is_set():
+            if self._ktimer is not None:
+                self._ktimer.clear()
+            wait = self._stop_play.wait if self._ktimer is None else self._ktimer.wait
+
+            # speed as an exact ratio: targets are pure integer math, no float drift over long loops
+            sp = Fraction(max(speed, 0.05)).limit_denominator(1000)
+            sp_num, sp_den = sp.numerator, sp.denominator
+            events = self.events
+
+            dispatch = self._make_dispatch()
+
+            def play_once(plan):
+                now = self.now
+                clock = base = now()
+                for off, fn, args, next_move in plan:
+                    if self._stop_flag:
                         return
-                    target = base + (ev.t / sp)
-                    while True:
-                        if self._stop_play.is_set():
-                            return
-                        dt = target - self.now()
-                        if dt <= 0:
-                            break
-                        time.sleep(min(dt, 0.01))
-                    self._apply_event(ev)
+                    target = base + off
+                    # the clock is only read for a step that wasn't due at the last reading, so a
+                    # burst of due steps (dense moves, equal timestamps) fires without re-reading it
+                    if target > clock:
+                        clock = now()
+                        dt = target - clock
+                        if dt > 0:
+                            # one interruptible sleep up to ~1ms before the deadline, then spin
+                            if dt > 2_000_000 and wait((dt - 1_000_000) / 1e9):
+                                return
+                            while clock < target:
+                                if self._stop_flag:
+                                    return
+                                clock = now()
+                    if next_move is not None and base + next_move <= clock:
+                        # the following move is due as well: the cursor only needs the newest
+                        # position, so skip this warp
+                        continue
+                    fn(*args)
 
             def run():
+                _timer_res_acquire()
                 try:
+                    # decode once into (scaled offset_ns, handler, payload, next move) steps;
+                    # every loop/repeat then just unpacks tuples
+                    cached = self._play_cols
+                    if cached is not None and cached[0] is events:
+                        ts, kinds, payloads = cached[1]
+                    else:
+                        ts, kinds, payloads = cols = self._compile(events)
+                        self._play_cols = (events, cols)
+                    if not ts:
+                        self.log.warn("No playable events.")
+                        return
+                    # offsets are scaled by the speed ratio here, once, not per event per loop
+                    rel = [off * sp_den // sp_num for off in ts] if sp_num != sp_den else ts
+                    # offset of the next step when both this one and it are moves, else None
+                    next_move = [None] * len(kinds)
+                    for i in range(len(kinds) - 1):
+                        if kinds[i] == _K_MOVE and kinds[i + 1] == _K_MOVE:
+                            next_move[i] = rel[i + 1]
+                    plan = tuple(zip(rel, [dispatch[k] for k in kinds], payloads, next_move))
                     if start_delay > 0:
-                        end = time.time() + start_delay
-                        while time.time() < end and not self._stop_play.is_set():
-                            time.sleep(0.01)
+                        wait(start_delay)
 
                     if loop_seconds > 0:
-                        started = time.time()
-                        while not self._stop_play.is_set() and (time.time() - started) < loop_seconds:
-                            play_once()
+                        end = self.now() + loop_seconds * 1_000_000_000
+                        while not self._stop_flag and self.now() < end:
+                            play_once(plan)
                     else:
                         for _ in range(max(1, repeat)):
-                            if self._stop_play.is_set():
+                            if self._stop_flag:
                                 break
-                            play_once()
+                            play_once(plan)
                 except Exception as e:
                     self.log.error(f"Playback error: {e}")
                     self.log.error(traceback.format_exc())
                 finally:
                     with self._play_lock:
                         self.playing = False
+                        self._stop_flag = True
                         self._stop_play.set()
                     # IMPORTANT: release all modifiers after playback finishes or is interrupted
                     self.release_all_modifiers()
+                    _timer_res_release()
+                    self._notify("ready")
 
+            # before the thread starts, so a short take can't report "ready" first
+            self._notify("playing")
             threading.Thread(target=run, daemon=True).start()
 
 
@@ -845,6 +1494,13 @@ class HotkeyManager:
     def __init__(self, logger: Logger):
         self.log = logger
         self._listener = None
+        # canonical key -> (combo, callback) pairs containing it, in mapping order; a press only
+        # checks the combos it can complete. Like pynput's HotKey, a combo fires once all of its
+        # keys are held, whatever else is held too (F6 still fires while Ctrl is down).
+        self._combos_by_key: Dict[Any, List[tuple]] = {}
+        # only keys that appear in some combo are tracked
+        self._hk_keys: frozenset = frozenset()
+        self._pressed: set = set()
 
     def set(self, mapping: Dict[str, Callable[[], None]]):
         try:
@@ -854,12 +1510,50 @@ class HotkeyManager:
             pass
 
         try:
-            self._listener = keyboard.GlobalHotKeys(mapping)
+            by_key: Dict[Any, List[tuple]] = {}
+            count = 0
+            for hk, cb in mapping.items():
+                try:
+                    combo = frozenset(keyboard.HotKey.parse(hk))
+                except ValueError:
+                    self.log.warn(f"Hotkey skipped (cannot parse): {hk}")
+                    continue
+                count += 1
+                for k in combo:
+                    by_key.setdefault(k, []).append((combo, cb))
+            self._combos_by_key = by_key
+            self._hk_keys = frozenset(by_key)
+            self._pressed = set()
+
+            self._listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release)
             self._listener.start()
-            self.log.info(f"Hotkeys active: {len(mapping)}")
+            self.log.info(f"Hotkeys active: {count}")
         except Exception as e:
             self.log.error(f"Hotkeys error: {e}")
 
+    # pynput >= 1.8 sees two parameters and passes `injected`: keys our own playback sends
+    # must not trigger hotkeys (GlobalHotKeys ignores them too). Older pynput calls
+    # on_press(key) and never reports injection, hence the default.
+    def _on_press(self, key, injected=False):
+        listener = self._listener
+        if listener is None or injected:
+            return
+        k = listener.canonical(key)
+        if k not in self._hk_keys or k in self._pressed:
+            # untracked key, or OS auto-repeat of a key already held
+            return
+        pressed = self._pressed
+        pressed.add(k)
+        for combo, cb in self._combos_by_key[k]:
+            if combo <= pressed:
+                cb()
+
+    def _on_release(self, key, injected=False):
+        listener = self._listener
+        if listener is None or injected:
+            return
+        self._pressed.discard(listener.canonical(key))
+
     def shutdown(self):
         try:
             if self._listener:
@@ -872,28 +1566,199 @@ class HotkeyManager:
 # GitHub updater (manifest + bundle) with caching (ETag/Last-Modified)
 # ============================================================
 
-def _http_get(url: str, headers: Dict[str, str], timeout: int = 15):
+# ETag/Last-Modified meta files, read once per run; changes are written back shortly after
+# they happen (debounced like MacroDB saves) and once more at exit
+_META_SAVE_DELAY = 0.25
+_meta_lock = threading.Lock()
+_meta_cache: Dict[str, Dict[str, Any]] = {}
+_meta_dirty: set = set()
+_meta_timer: Optional[threading.Timer] = None
+
+def _meta_get(path: str) -> Dict[str, Any]:
+    with _meta_lock:
+        meta = _meta_cache.get(path)
+        if meta is None:
+            meta = _read_json(path, {})
+            if not isinstance(meta, dict):
+                meta = {}
+            _meta_cache[path] = meta
+        return dict(meta)
+
+def _meta_set(path: str, meta: Dict[str, Any]):
+    global _meta_timer
+    with _meta_lock:
+        _meta_cache[path] = dict(meta)
+        _meta_dirty.add(path)
+        # a crash or kill must not cost the next start its validators
+        if _meta_timer is not None:
+            _meta_timer.cancel()
+        _meta_timer = threading.Timer(_META_SAVE_DELAY, _flush_meta)
+        _meta_timer.daemon = True
+        _meta_timer.start()
+
+def _flush_meta():
+    with _meta_lock:
+        for path in list(_meta_dirty):
+            try:
+                _atomic_write_json(path, _meta_cache[path])
+            except Exception:
+                pass
+        _meta_dirty.clear()
+
+atexit.register(_flush_meta)
+
+_OPENER = urllib.request.build_opener()
+
+@functools.lru_cache(maxsize=1)
+def _proxies() -> Dict[str, str]:
+    # same source the opener's ProxyHandler reads (environment, registry, macOS settings)
+    return {k: v for k, v in urllib.request.getproxies().items() if k != "no"}
+
+def _direct_ok(host: str) -> bool:
+    """True when no proxy applies to host, so a direct pooled connection reaches it like urllib would."""
+    return not _proxies() or bool(urllib.request.proxy_bypass(host))
+
+# idle keep-alive HTTPS connections per host, so back-to-back GitHub requests skip the TLS handshake
+_conn_lock = threading.Lock()
+_idle_conns: Dict[str, List[http.client.HTTPSConnection]] = {}
+
+def _take_conn(host: str, timeout: int) -> http.client.HTTPSConnection:
+    with _conn_lock:
+        pool = _idle_conns.get(host)
+        conn = pool.pop() if pool else None
+    if conn is None:
+        return http.client.HTTPSConnection(host, timeout=timeout)
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+def _give_conn(host: str, conn: http.client.HTTPSConnection):
+    with _conn_lock:
+        _idle_conns.setdefault(host, []).append(conn)
+
+def _urllib_get(url: str, headers: Dict[str, str], timeout: int):
     req = urllib.request.Request(url, headers=headers, method="GET")
-    return urllib.request.urlopen(req, timeout=timeout)
+    return _OPENER.open(req, timeout=timeout)
+
+@contextlib.contextmanager
+def _http_get(url: str, headers: Dict[str, str], timeout: int = 15):
+    """GET over a pooled keep-alive connection; proxied hosts, redirects and stale pooled sockets go through urllib.
+
+    Like urlopen, any final status outside 2xx (304 included) raises urllib.error.HTTPError.
+    """
+    parts = urllib.parse.urlsplit(url)
+    resp = None
+    if parts.scheme == "https" and _direct_ok(parts.netloc):
+        host = parts.netloc
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        conn = _take_conn(host, timeout)
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+        except Exception:
+            conn.close()
+            if not reused:
+                # a fresh connect failed (offline, DNS, timeout): urllib would only wait it out again
+                raise
+            # the server dropped an idle pooled socket: retry once on the plain path below
+            resp = None
+        if resp is not None and resp.status in (301, 302, 303, 307, 308):
+            resp.read()
+            _give_conn(host, conn)
+            resp = None
+        elif resp is not None and not 200 <= resp.status < 300:
+            if resp.status == 304 and not resp.will_close:
+                # no body; the socket stays usable
+                resp.read()
+                _give_conn(host, conn)
+            else:
+                conn.close()
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+
+    if resp is None:
+        with _urllib_get(url, headers, timeout) as fallback:
+            yield fallback
+        return
+
+    try:
+        yield resp
+    finally:
+        reusable = not resp.will_close
+        if reusable and not resp.isclosed():
+            if resp.length == 0:
+                resp.read()
+            else:
+                # caller stopped mid-body; the socket position is unknown
+                reusable = False
+        if reusable:
+            _give_conn(host, conn)
+        else:
+            resp.close()
+            conn.close()
+
+_revalidating: set = set()
+
+def _is_fresh(meta: Dict[str, Any]) -> bool:
+    try:
+        return time.time() - float(meta.get("fetched_at", 0)) < HTTP_CACHE_FRESH_SECONDS
+    except (TypeError, ValueError):
+        return False
+
+def _touch_meta(meta_path: str):
+    # a 304 confirms the cached copy, so it counts as freshly fetched
+    meta = _meta_get(meta_path)
+    meta["fetched_at"] = int(time.time())
+    _meta_set(meta_path, meta)
+
+def _revalidate_async(key: str, fn: Callable[..., Any], *args):
+    with _meta_lock:
+        if key in _revalidating:
+            return
+        _revalidating.add(key)
+
+    def run():
+        try:
+            fn(*args)
+        except Exception:
+            pass
+        finally:
+            with _meta_lock:
+                _revalidating.discard(key)
+
+    threading.Thread(target=run, daemon=True).start()
 
 def _http_read_json(url: str, cache_body_path: str, cache_meta_path: str) -> Dict[str, Any]:
-    meta = _read_json(cache_meta_path, {})
-    headers = {"User-Agent": f"{APP_NAME}/1.0"}
+    """Stale-while-revalidate read of a JSON document cached on disk."""
+    cached = _read_json(cache_body_path, None)
+    if isinstance(cached, dict) and cached:
+        if not _is_fresh(_meta_get(cache_meta_path)):
+            _revalidate_async(url, _fetch_json, url, cache_body_path, cache_meta_path)
+        return cached
+    return _fetch_json(url, cache_body_path, cache_meta_path)
+
+def _fetch_json(url: str, cache_body_path: str, cache_meta_path: str) -> Dict[str, Any]:
+    meta = _meta_get(cache_meta_path)
+    headers = {"User-Agent": f"{APP_NAME}/{APP_VERSION}"}
     etag = meta.get("etag")
     last = meta.get("last_modified")
-    if etag:
-        headers["If-None-Match"] = etag
-    if last:
-        headers["If-Modified-Since"] = last
+    # a 304 is only useful with the cached body still on disk
+    if os.path.exists(cache_body_path):
+        if etag:
+            headers["If-None-Match"] = etag
+        if last:
+            headers["If-Modified-Since"] = last
 
     try:
         with _http_get(url, headers=headers, timeout=15) as resp:
             code = getattr(resp, "status", 200)
             if code == 304:
+                _touch_meta(cache_meta_path)
                 cached = _read_json(cache_body_path, {})
                 return cached if isinstance(cached, dict) else {}
-            body = resp.read().decode("utf-8", errors="replace")
-            data = json.loads(body) if body else {}
+            body = resp.read()
+            data = _json_loads(body) if body else {}
             if isinstance(data, dict):
                 _atomic_write_json(cache_body_path, data)
             new_meta = {
@@ -901,10 +1766,11 @@ def _http_read_json(url: str, cache_body_path: str, cache_meta_path: str) -> Dic
                 "last_modified": resp.headers.get("Last-Modified"),
                 "fetched_at": int(time.time())
             }
-            _atomic_write_json(cache_meta_path, new_meta)
+            _meta_set(cache_meta_path, new_meta)
             return data if isinstance(data, dict) else {}
     except urllib.error.HTTPError as e:
         if e.code == 304:
+            _touch_meta(cache_meta_path)
             cached = _read_json(cache_body_path, {})
             return cached if isinstance(cached, dict) else {}
         cached = _read_json(cache_body_path, {})
@@ -913,27 +1779,33 @@ def _http_read_json(url: str, cache_body_path: str, cache_meta_path: str) -> Dic
         cached = _read_json(cache_body_path, {})
         return cached if isinstance(cached, dict) else {}
 
+def _stream_to_file(resp, dst: str, on_progress: Optional[Callable[[int, int], None]] = None,
+                    chunk_size: int = 64 * 1024):
+    # body goes to disk chunk by chunk via dst.tmp, never fully in memory
+    _ensure_dir(os.path.dirname(dst))
+    tmp = dst + ".tmp"
+    with open(tmp, "wb") as f:
+        if on_progress is None:
+            shutil.copyfileobj(resp, f, chunk_size)
+        else:
+            total = resp.headers.get("Content-Length")
+            total_i = int(total) if total and total.isdigit() else -1
+            got = 0
+            while True:
+                chunk = resp.read(chunk_size)
+                if not chunk:
+                    break
+                f.write(chunk)
+                got += len(chunk)
+                on_progress(got, total_i)
+    os.replace(tmp, dst)
+
 def _http_download(url: str, dst: str, headers: Dict[str, str],
                    on_progress: Optional[Callable[[int, int], None]] = None,
                    timeout: int = 30) -> bool:
     try:
-        req = urllib.request.Request(url, headers=headers, method="GET")
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            total = resp.headers.get("Content-Length")
-            total_i = int(total) if total and total.isdigit() else -1
-            _ensure_dir(os.path.dirname(dst))
-            tmp = dst + ".tmp"
-            got = 0
-            with open(tmp, "wb") as f:
-                while True:
-                    chunk = resp.read(64 * 1024)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    got += len(chunk)
-                    if on_progress:
-                        on_progress(got, total_i)
-            os.replace(tmp, dst)
+        with _http_get(url, headers=headers, timeout=timeout) as resp:
+            _stream_to_file(resp, dst, on_progress)
         return True
     except Exception:
         try:
@@ -945,55 +1817,56 @@ def _http_download(url: str, dst: str, headers: Dict[str, str],
 
 def _cached_download_with_meta(url: str, dst: str, meta_path: str,
                                on_progress: Optional[Callable[[int, int], None]] = None) -> bool:
-    meta = _read_json(meta_path, {})
-    headers = {"User-Agent": f"{APP_NAME}/1.0"}
-    if meta.get("etag"):
-        headers["If-None-Match"] = meta["etag"]
-    if meta.get("last_modified"):
-        headers["If-Modified-Since"] = meta["last_modified"]
+    """Stale-while-revalidate download: an existing dst is kept and refreshed in the background."""
+    if os.path.exists(dst):
+        if not _is_fresh(_meta_get(meta_path)):
+            _revalidate_async(url, _download_with_meta, url, dst, meta_path, None)
+        return True
+    return _download_with_meta(url, dst, meta_path, on_progress)
+
+def _download_with_meta(url: str, dst: str, meta_path: str,
+                        on_progress: Optional[Callable[[int, int], None]] = None) -> bool:
+    meta = _meta_get(meta_path)
+    headers = {"User-Agent": f"{APP_NAME}/{APP_VERSION}"}
+    # validators only while dst exists: a deleted file must be fetched again, not 304'd forever
+    if os.path.exists(dst):
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
 
     try:
-        req = urllib.request.Request(url, headers=headers, method="GET")
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        with _http_get(url, headers=headers, timeout=15) as resp:
             code = getattr(resp, "status", 200)
             if code == 304 and os.path.exists(dst):
+                _touch_meta(meta_path)
                 return True
 
-            total = resp.headers.get("Content-Length")
-            total_i = int(total) if total and total.isdigit() else -1
-            _ensure_dir(os.path.dirname(dst))
-            tmp = dst + ".tmp"
-            got = 0
-            with open(tmp, "wb") as f:
-                while True:
-                    chunk = resp.read(64 * 1024)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    got += len(chunk)
-                    if on_progress:
-                        on_progress(got, total_i)
-            os.replace(tmp, dst)
+            _stream_to_file(resp, dst, on_progress)
 
             new_meta = {
                 "etag": resp.headers.get("ETag"),
                 "last_modified": resp.headers.get("Last-Modified"),
                 "fetched_at": int(time.time())
             }
-            _atomic_write_json(meta_path, new_meta)
+            _meta_set(meta_path, new_meta)
             return True
 
     except urllib.error.HTTPError as e:
         if e.code == 304 and os.path.exists(dst):
+            _touch_meta(meta_path)
             return True
         return os.path.exists(dst)
     except Exception:
         return os.path.exists(dst)
 
+def _norm_version(v: Any) -> str:
+    # canonical, interned form: equal versions compare by identity
+    return sys.intern(str(v).strip()) if v else ""
+
 def _load_local_version() -> str:
     d = _read_json(LOCAL_VERSION_FILE, {})
-    v = d.get("version")
-    return str(v) if v else ""
+    return _norm_version(d.get("version"))
 
 def _save_local_version(v: str):
     _atomic_write_json(LOCAL_VERSION_FILE, {"version": str(v), "updated_at": int(time.time())})
@@ -1002,7 +1875,7 @@ def _extract_zip(zip_path: str, dst_dir: str):
     tmp_dir = dst_dir + ".__new__"
     if os.path.exists(tmp_dir):
         shutil.rmtree(tmp_dir, ignore_errors=True)
-    _ensure_dir(tmp_dir)
+    os.makedirs(tmp_dir, exist_ok=True)
 
     with zipfile.ZipFile(zip_path, "r") as z:
         z.extractall(tmp_dir)
@@ -1017,6 +1890,24 @@ def _extract_zip(zip_path: str, dst_dir: str):
     if os.path.exists(backup):
         shutil.rmtree(backup, ignore_errors=True)
 
+# set by the app's on_close: a bundle download still running stops at its next chunk
+_update_cancel = threading.Event()
+
+def _run_daemon(fn: Callable[..., Any], *args) -> Future:
+    """Run fn(*args) on a daemon thread; unlike executor workers it never keeps the process alive at exit."""
+    fut: Future = Future()
+
+    def run():
+        if not fut.set_running_or_notify_cancel():
+            return
+        try:
+            fut.set_result(fn(*args))
+        except BaseException as e:
+            fut.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return fut
+
 def check_and_update(progress_cb: Callable[[float, str], None]) -> str:
     """
     Returns status string: "ok" / "offline" / "updated"
@@ -1027,7 +1918,7 @@ def check_and_update(progress_cb: Callable[[float, str], None]) -> str:
         progress_cb(0.25, "Offline mode (no manifest).")
         return "offline"
 
-    remote_ver = str(manifest.get("version", "")).strip()
+    remote_ver = _norm_version(manifest.get("version"))
     bundle_url = str(manifest.get("bundle_url", "")).strip()
     bundle_sha = str(manifest.get("bundle_sha256", "")).strip().lower()
 
@@ -1035,8 +1926,7 @@ def check_and_update(progress_cb: Callable[[float, str], None]) -> str:
         progress_cb(0.25, "Manifest invalid. Starting…")
         return "offline"
 
-    local_ver = _load_local_version()
-    if local_ver == remote_ver and os.path.exists(DIR_APP):
+    if _load_local_version() == remote_ver and os.path.exists(DIR_APP):
         progress_cb(0.35, f"No updates (v{remote_ver}).")
         return "ok"
 
@@ -1044,13 +1934,16 @@ def check_and_update(progress_cb: Callable[[float, str], None]) -> str:
     zip_path = os.path.join(DIR_CACHE, f"bundle_{remote_ver}.zip")
 
     def on_dl(got: int, total: int):
+        if _update_cancel.is_set():
+            # _http_download drops the partial .tmp file and reports failure
+            raise InterruptedError("update cancelled")
         if total > 0:
             p = 0.35 + 0.45 * (got / total)
             progress_cb(p, f"Downloading… {int(100 * got / total)}%")
         else:
             progress_cb(0.55, "Downloading…")
 
-    ok = _http_download(bundle_url, zip_path, headers={"User-Agent": f"{APP_NAME}/1.0"}, on_progress=on_dl, timeout=60)
+    ok = _http_download(bundle_url, zip_path, headers={"User-Agent": f"{APP_NAME}/{APP_VERSION}"}, on_progress=on_dl, timeout=60)
     if not ok:
         progress_cb(0.70, "Download failed. Starting…")
         return "offline"
@@ -1066,6 +1959,9 @@ def check_and_update(progress_cb: Callable[[float, str], None]) -> str:
             progress_cb(0.86, "Verification failed. Starting…")
             return "offline"
 
+    if _update_cancel.is_set():
+        return "offline"
+
     progress_cb(0.88, "Installing…")
     try:
         _extract_zip(zip_path, DIR_APP)
@@ -1082,32 +1978,24 @@ def check_and_update(progress_cb: Callable[[float, str], None]) -> str:
 # Icon handling (cached download + local load)
 # ============================================================
 
-def load_app_icon_photo(master: ctk.CTk) -> Optional[ctk.CTkImage]:
-    try:
-        # cache online icon once (ETag/Last-Modified)
-        def _p(_got, _total): pass
-        _cached_download_with_meta(ICON_PNG_URL, CACHED_ICON_FILE, CACHED_ICON_META, on_progress=_p)
-    except Exception:
-        pass
-
-    try:
-        if os.path.exists(CACHED_ICON_FILE):
-            img = ctk.CTkImage(light_image=None, dark_image=None, size=(64, 64))
-            # CTkImage wants PIL images normally; use Tk PhotoImage instead for iconphoto
-            return None
-    except Exception:
-        pass
-    return None
+@functools.lru_cache(maxsize=2)
+def _icon_data(mtime_ns: int) -> bytes:
+    # base64 PNG for PhotoImage(data=...); the splash and the app (two Tk roots) each need a
+    # PhotoImage, but the file is read once per version of it (the key is its mtime)
+    with open(CACHED_ICON_FILE, "rb") as f:
+        return base64.b64encode(f.read())
 
 def apply_window_icon(root: ctk.CTk):
     # Tk iconphoto supports PNG via PhotoImage
     try:
         import tkinter as tk
-        path = CACHED_ICON_FILE if os.path.exists(CACHED_ICON_FILE) else None
-        if path:
-            photo = tk.PhotoImage(file=path)
-            root.iconphoto(True, photo)
-            root._saonix_icon_ref = photo  # keep ref
+        try:
+            mtime_ns = os.stat(CACHED_ICON_FILE).st_mtime_ns
+        except OSError:
+            return
+        photo = tk.PhotoImage(master=root, data=_icon_data(mtime_ns))
+        root.iconphoto(True, photo)
+        root._saonix_icon_ref = photo  # keep ref
     except Exception:
         pass
 
@@ -1117,7 +2005,11 @@ def apply_window_icon(root: ctk.CTk):
 # ============================================================
 
 class Loader(ctk.CTk):
-    def __init__(self):
+    # longest the splash waits on the update check; the bundle installs for the next launch,
+    # so a slow manifest/download finishes in the background while the app runs
+    UPDATE_WAIT = 2.0
+
+    def __init__(self, progress_q: "queue.Queue[tuple]", icon_fut: Future, update_fut: Future):
         super().__init__()
         ctk.set_appearance_mode("Dark")
         self.title(APP_NAME)
@@ -1149,33 +2041,20 @@ class Loader(ctk.CTk):
         self.lbl_support = ctk.CTkLabel(self.wrap, text=f"Support: Discord {SUPPORT_DISCORD}", font=ctk.CTkFont(size=12))
         self.lbl_support.grid(row=4, column=0, sticky="w", padx=18, pady=(10, 18))
 
-        self._q: "queue.Queue[tuple]" = queue.Queue()
+        # network work was already started by main(); we only consume the results here
+        self._q = progress_q
+        self._icon_fut: Optional[Future] = icon_fut
+        self._update_fut = update_fut
         self._done = False
         self._update_status = "ok"
+        self._deadline = time.monotonic() + self.UPDATE_WAIT
 
-        threading.Thread(target=self._worker, daemon=True).start()
         self.after(50, self._pump)
 
     def _set_ui(self, p: float, status: str):
         self.bar.set(_clamp(p, 0.0, 1.0))
         self.lbl_status.configure(text=status)
 
-    def _worker(self):
-        try:
-            def progress_cb(p: float, msg: str):
-                self._q.put(("p", p, msg))
-            # cache icon once (no re-download if not changed)
-            self._q.put(("p", 0.02, "Preparing…"))
-            try:
-                _cached_download_with_meta(ICON_PNG_URL, CACHED_ICON_FILE, CACHED_ICON_META)
-            except Exception:
-                pass
-            self._update_status = check_and_update(progress_cb)
-            self._q.put(("done",))
-        except Exception:
-            self._q.put(("p", 0.30, "Starting…"))
-            self._q.put(("done",))
-
     def _pump(self):
         try:
             while True:
@@ -1185,11 +2064,24 @@ class Loader(ctk.CTk):
                 if item[0] == "p":
                     _, p, msg = item
                     self._set_ui(float(p), str(msg))
-                elif item[0] == "done":
-                    self._done = True
         except queue.Empty:
             pass
 
+        if self._icon_fut is not None and self._icon_fut.done():
+            # the icon may have just been downloaded for the first time
+            self._icon_fut = None
+            apply_window_icon(self)
+
+        if self._update_fut.done():
+            try:
+                self._update_status = self._update_fut.result()
+            except Exception:
+                self._set_ui(0.30, "Starting…")
+            self._done = True
+        elif time.monotonic() >= self._deadline:
+            self._set_ui(0.95, "Starting…")
+            self._done = True
+
         if self._done:
             self.after(200, self._start_app)
             return
@@ -1201,7 +2093,7 @@ class Loader(ctk.CTk):
             self.destroy()
         except Exception:
             pass
-        run_app()
+        run_app(self._update_fut)
 
 
 # ============================================================
@@ -1209,11 +2101,30 @@ class Loader(ctk.CTk):
 # ============================================================
 
 class SaonixApp(ctk.CTk):
-    def __init__(self):
+    # every i18n key apply_texts() pushes into widgets
+    _UI_KEYS = (
+        "app_title", "nav_record", "nav_library", "nav_settings",
+        "style", "theme", "language", "glow", "support", "support_text",
+        "page_record", "page_library", "page_settings",
+        "rec_controls", "rec_start", "rec_stop", "rec_play_loaded", "rec_stop_play",
+        "rec_save_label", "rec_save_btn", "rec_clear_log", "rec_tips",
+        "lib_title", "search_ph", "btn_load", "btn_delete", "btn_rename", "btn_clone",
+        "btn_export", "btn_import", "bind", "bind_ph", "bind_set", "bind_remove", "play_selected",
+        "settings_playback", "apply", "reset", "base_hotkeys", "hk_apply",
+        "repeat", "loop", "speed", "delay",
+        "hk_rec", "hk_stoprec", "hk_play", "hk_stop",
+        "status_recording", "status_playing", "status_ready",
+    )
+    # the log box keeps only the tail; the full log is in LOG_FILE
+    _LOG_MAX_LINES = 2000
+
+    def __init__(self, update_fut: Optional[Future] = None):
         super().__init__()
 
-        self.db = MacroDB(DB_FILE)
-        saved = self.db.get_settings()
+        self.db = MacroDB(DB_FILE, legacy_path=LEGACY_DB_FILE)
+        # authoritative copy of the saved settings; read once here, _flush_settings writes it back
+        self._settings: Dict[str, Any] = self.db.get_settings()
+        saved = self._settings
 
         # i18n
         lang = str(saved.get("lang", "auto"))
@@ -1245,8 +2156,20 @@ class SaonixApp(ctk.CTk):
         self._active_page = "record"
         self.selected_macro: Optional[str] = None
         self.macro_buttons: Dict[str, ctk.CTkButton] = {}
+        # library list widgets are reused: hidden buttons wait here, the "empty" label is made once
+        self._lib_pool: List[ctk.CTkButton] = []
+        self._lib_empty: Optional[ctk.CTkLabel] = None
 
-        self.title(self.i18n.t("app_title"))
+        # pending after() id of a debounced persist_settings
+        self._persist_job: Optional[str] = None
+        # pending after() id of the glow-border repaint while the slider is dragged
+        self._glow_job: Optional[str] = None
+
+        # file reads/writes for export/import; results are picked up on the Tk thread by _when_done
+        self._io = ThreadPoolExecutor(max_workers=1)
+
+        t = self.i18n.t
+        self.title(t("app_title"))
         self.geometry("1180x720")
         self.minsize(1080, 680)
         self.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -1255,10 +2178,18 @@ class SaonixApp(ctk.CTk):
 
         # logger -> UI
         self.log_box: Optional[ctk.CTkTextbox] = None
+        # lines from any thread queue here; _flush_log writes them in one insert per batch
+        self._log_buf: "collections.deque[str]" = collections.deque()
+        self._log_job = None
         log.set_sink(self._append_log_ui)
 
         self.engine = MacroEngine(log)
+        # (name, db revision, events list) last put into engine.events from the library; replaying
+        # an unchanged macro hands the engine the same list, so its compiled plan is reused
+        self._events_src: Optional[tuple] = None
         self.hk = HotkeyManager(log)
+        # (base hotkeys, binds) last handed to self.hk; see rebuild_hotkeys
+        self._hk_sig: Optional[tuple] = None
 
         # layout
         self.grid_columnconfigure(1, weight=1)
@@ -1269,53 +2200,54 @@ class SaonixApp(ctk.CTk):
         self.sidebar.grid_columnconfigure(0, weight=1)
         self.sidebar.grid_rowconfigure(99, weight=1)
 
-        self.lbl_brand = ctk.CTkLabel(self.sidebar, text=self.i18n.t("app_title"),
+        self.lbl_brand = ctk.CTkLabel(self.sidebar, text=t("app_title"),
                                       font=ctk.CTkFont(family="Times New Roman", size=26, weight="bold"))
         self.lbl_brand.grid(row=0, column=0, padx=16, pady=(16, 2), sticky="w")
 
         self.lbl_tag = ctk.CTkLabel(self.sidebar, text="Macro Recorder", font=ctk.CTkFont(size=14))
         self.lbl_tag.grid(row=1, column=0, padx=16, pady=(0, 10), sticky="w")
 
-        self.btn_record = ctk.CTkButton(self.sidebar, text=self.i18n.t("nav_record"),
+        self.btn_record = ctk.CTkButton(self.sidebar, text=t("nav_record"),
                                         command=lambda: self.show_page("record"))
-        self.btn_library = ctk.CTkButton(self.sidebar, text=self.i18n.t("nav_library"),
+        self.btn_library = ctk.CTkButton(self.sidebar, text=t("nav_library"),
                                          command=lambda: self.show_page("library"))
-        self.btn_settings = ctk.CTkButton(self.sidebar, text=self.i18n.t("nav_settings"),
+        self.btn_settings = ctk.CTkButton(self.sidebar, text=t("nav_settings"),
                                           command=lambda: self.show_page("settings"))
         self.btn_record.grid(row=2, column=0, padx=16, pady=8, sticky="ew")
         self.btn_library.grid(row=3, column=0, padx=16, pady=8, sticky="ew")
         self.btn_settings.grid(row=4, column=0, padx=16, pady=8, sticky="ew")
 
-        self.lbl_style = ctk.CTkLabel(self.sidebar, text=self.i18n.t("style"), font=ctk.CTkFont(weight="bold"))
+        self.lbl_style = ctk.CTkLabel(self.sidebar, text=t("style"), font=ctk.CTkFont(weight="bold"))
         self.lbl_style.grid(row=6, column=0, padx=16, pady=(18, 4), sticky="w")
         self.style_menu = ctk.CTkOptionMenu(self.sidebar, values=list(STYLES.keys()), command=self.set_style)
         self.style_menu.set(style_name if style_name in STYLES else "Calm")
         self.style_menu.grid(row=7, column=0, padx=16, pady=6, sticky="ew")
 
-        self.lbl_mode = ctk.CTkLabel(self.sidebar, text=self.i18n.t("theme"), font=ctk.CTkFont(weight="bold"))
+        self.lbl_mode = ctk.CTkLabel(self.sidebar, text=t("theme"), font=ctk.CTkFont(weight="bold"))
         self.lbl_mode.grid(row=8, column=0, padx=16, pady=(10, 4), sticky="w")
         self.mode_menu = ctk.CTkOptionMenu(self.sidebar,
-                                           values=[self.i18n.t("theme_dark"), self.i18n.t("theme_light")],
+                                           values=[t("theme_dark"), t("theme_light")],
                                            command=self.set_mode)
-        self.mode_menu.set(self.i18n.t("theme_dark") if ctk.get_appearance_mode() == "Dark" else self.i18n.t("theme_light"))
+        self.mode_menu.set(t("theme_dark") if ctk.get_appearance_mode() == "Dark" else t("theme_light"))
         self.mode_menu.grid(row=9, column=0, padx=16, pady=6, sticky="ew")
 
-        self.lbl_lang = ctk.CTkLabel(self.sidebar, text=self.i18n.t("language"), font=ctk.CTkFont(weight="bold"))
+        self.lbl_lang = ctk.CTkLabel(self.sidebar, text=t("language"), font=ctk.CTkFont(weight="bold"))
         self.lbl_lang.grid(row=10, column=0, padx=16, pady=(10, 4), sticky="w")
         self.lang_menu = ctk.CTkOptionMenu(self.sidebar, values=["auto"] + I18N.SUPPORTED, command=self.set_lang)
         self.lang_menu.set(lang if lang in (["auto"] + I18N.SUPPORTED) else "auto")
         self.lang_menu.grid(row=11, column=0, padx=16, pady=6, sticky="ew")
 
-        self.lbl_glow = ctk.CTkLabel(self.sidebar, text=self.i18n.t("glow"), font=ctk.CTkFont(weight="bold"))
+        self.lbl_glow = ctk.CTkLabel(self.sidebar, text=t("glow"), font=ctk.CTkFont(weight="bold"))
         self.lbl_glow.grid(row=12, column=0, padx=16, pady=(14, 4), sticky="w")
         self.glow_slider = ctk.CTkSlider(self.sidebar, from_=0, to=3, number_of_steps=3, command=self._on_glow)
         self.glow_slider.set(int(self.glow_var.get()))
         self.glow_slider.grid(row=13, column=0, padx=16, pady=(0, 10), sticky="ew")
+        self.glow_slider.bind("<ButtonRelease-1>", self._on_glow_release)
 
         # support info (one time, bottom-left)
-        self.support_title = ctk.CTkLabel(self.sidebar, text=self.i18n.t("support"), font=ctk.CTkFont(weight="bold"))
+        self.support_title = ctk.CTkLabel(self.sidebar, text=t("support"), font=ctk.CTkFont(weight="bold"))
         self.support_title.grid(row=98, column=0, padx=16, pady=(0, 4), sticky="w")
-        self.support_text = ctk.CTkLabel(self.sidebar, text=self.i18n.t("support_text"), justify="left")
+        self.support_text = ctk.CTkLabel(self.sidebar, text=t("support_text"), justify="left")
         self.support_text.grid(row=99, column=0, padx=16, pady=(0, 14), sticky="sw")
 
         # main
@@ -1328,10 +2260,14 @@ class SaonixApp(ctk.CTk):
         self.header.grid(row=0, column=0, sticky="ew", padx=14, pady=(14, 8))
         self.header.grid_columnconfigure(0, weight=1)
 
-        self.h_title = ctk.CTkLabel(self.header, text=self.i18n.t("page_record"), font=ctk.CTkFont(size=18, weight="bold"))
+        self.h_title = ctk.CTkLabel(self.header, text=t("page_record"), font=ctk.CTkFont(size=18, weight="bold"))
         self.h_title.grid(row=0, column=0, padx=14, pady=12, sticky="w")
 
-        self.status_var = ctk.StringVar(value=self.i18n.t("status_ready"))
+        self.status_var = ctk.StringVar(value=t("status_ready"))
+        # engine state from the last on_state_change, and the one last written to status_var
+        # (None forces the next write)
+        self._status = "ready"
+        self._last_status: Optional[str] = None
         self.h_status = ctk.CTkLabel(self.header, textvariable=self.status_var)
         self.h_status.grid(row=0, column=1, padx=14, pady=12, sticky="e")
 
@@ -1347,29 +2283,70 @@ class SaonixApp(ctk.CTk):
             p.grid(row=0, column=0, sticky="nsew")
             p.grid_remove()
 
-        # build
-        self.build_record_page()
-        self.build_library_page()
-        self.build_settings_page()
+        # pages are built on first show; record is shown right away, the rest wait for the user
+        self._built_panels: set = set()
+        self._page_parts = {
+            "record": (self.build_record_page, self._texts_record, self._style_record),
+            "library": (self.build_library_page, self._texts_library, self._style_library),
+            "settings": (self.build_settings_page, self._texts_settings, self._style_settings),
+        }
 
         self.apply_texts()
         self.apply_style()
 
         self.show_page("record")
-        self.rebuild_hotkeys()
+        # installing the global keyboard hook is the slowest part of startup; let the window paint first
+        self.after_idle(self.rebuild_hotkeys)
+
+        # the engine pushes its transitions (from hook/playback threads); hop onto the Tk loop
+        self.engine.on_state_change = lambda st: self.after(0, self._apply_status, st)
 
-        self.after(200, self.tick)
+        if update_fut is not None and not update_fut.done():
+            # the splash stopped waiting for it; report the outcome from the Tk loop
+            def on_update(fut: Future):
+                try:
+                    self.after(0, self._on_update_done, fut)
+                except Exception:
+                    pass  # window already closed
+
+            update_fut.add_done_callback(on_update)
 
         log.info("Started.")
 
+    def _on_update_done(self, fut: Future):
+        try:
+            status = fut.result()
+        except Exception as e:
+            log.error(f"Update check failed: {e}")
+            return
+        if status == "updated":
+            log.info("Update installed. Restart to use it.")
+
     # ---------------------------
     # Close
     # ---------------------------
     def on_close(self):
+        # a playback thread may still finish after destroy(); nothing left to update
+        self.engine.on_state_change = None
+        # an update still downloading in the background gives up at its next chunk
+        _update_cancel.set()
         try:
             self.engine.stop_playing()
         except Exception:
             pass
+        try:
+            if self._persist_job is not None:
+                self.after_cancel(self._persist_job)
+            # no-op unless something (e.g. a glow drag without a release) is still unsaved
+            self._flush_settings()
+            self.db.flush()
+        except Exception:
+            pass
+        try:
+            # let a running export finish writing its file
+            self._io.shutdown(wait=True)
+        except Exception:
+            pass
         try:
             self.hk.shutdown()
         except Exception:
@@ -1388,25 +2365,41 @@ class SaonixApp(ctk.CTk):
     # Log sink
     # ---------------------------
     def _append_log_ui(self, text: str):
+        if self.log_box is None:
+            return
+        self._log_buf.append(text)
+        if self._log_job is None:
+            try:
+                self._log_job = self.after(80, self._flush_log)
+            except Exception:
+                pass
+
+    def _flush_log(self):
+        # clear the job first: a line queued while we drain schedules the next batch
+        self._log_job = None
+        buf = self._log_buf
+        text = "".join([buf.popleft() for _ in range(len(buf))])
+        if not text:
+            return
         try:
-            if self.log_box is None:
-                return
-            self.log_box.insert("end", text)
-            self.log_box.see("end")
+            box = self.log_box
+            box.insert("end", text)
+            extra = int(box.index("end-1c").split(".")[0]) - self._LOG_MAX_LINES
+            if extra > 0:
+                box.delete("1.0", f"{extra + 1}.0")
+            box.see("end")
         except Exception:
             pass
 
     # ---------------------------
     # Tick / status
     # ---------------------------
-    def tick(self):
-        if self.engine.recording:
-            self.status_var.set(self.i18n.t("status_recording"))
-        elif self.engine.playing:
-            self.status_var.set(self.i18n.t("status_playing"))
-        else:
-            self.status_var.set(self.i18n.t("status_ready"))
-        self.after(200, self.tick)
+    def _apply_status(self, st: str):
+        self._status = st
+        # StringVar.set fires traces and redraws the label even for the same text
+        if st != self._last_status:
+            self._last_status = st
+            self.status_var.set(self._status_texts[st])
 
     # ---------------------------
     # Persist settings
@@ -1425,8 +2418,14 @@ class SaonixApp(ctk.CTk):
         self.delay_var.set(str(s.get("start_delay", 0.0)))
 
     def persist_settings(self):
-        s = self.db.get_settings()
-        s.update({
+        # coalesce bursts (slider drags, Apply then Apply hotkeys) into one snapshot of the UI
+        if self._persist_job is not None:
+            self.after_cancel(self._persist_job)
+        self._persist_job = self.after(300, self._flush_settings)
+
+    def _flush_settings(self):
+        self._persist_job = None
+        s = {
             "appearance": ctk.get_appearance_mode(),
             "style": self.style_menu.get(),
             "lang": self.lang_menu.get(),
@@ -1435,9 +2434,13 @@ class SaonixApp(ctk.CTk):
             "hk_stoprec": self.hk_stoprec_var.get(),
             "hk_play": self.hk_play_var.get(),
             "hk_stop": self.hk_stop_var.get(),
-        })
-        s.update(self.current_play_settings())
-        self.db.set_settings(s)
+            **self.current_play_settings(),
+        }
+        cur = self._settings
+        if all(k in cur and cur[k] == v for k, v in s.items()):
+            return
+        cur.update(s)
+        self.db.set_settings(cur)
 
     # ---------------------------
     # Theme/style/lang/glow
@@ -1456,18 +2459,48 @@ class SaonixApp(ctk.CTk):
         self.apply_style()
 
     def set_lang(self, lang: str):
+        if I18N.resolve(lang) == self.i18n.lang:
+            # e.g. "en" -> "auto" on an English system: only the saved choice changes
+            self.persist_settings()
+            return
         self.i18n.load(lang)
-        self.title(self.i18n.t("app_title"))
+        t = self.i18n.t
+        self.title(t("app_title"))
         # refresh option labels for theme menu
-        self.mode_menu.configure(values=[self.i18n.t("theme_dark"), self.i18n.t("theme_light")])
-        self.mode_menu.set(self.i18n.t("theme_dark") if ctk.get_appearance_mode() == "Dark" else self.i18n.t("theme_light"))
+        self.mode_menu.configure(values=[t("theme_dark"), t("theme_light")])
+        self.mode_menu.set(t("theme_dark") if ctk.get_appearance_mode() == "Dark" else t("theme_light"))
         self.persist_settings()
         self.apply_texts()
 
+    # bordered cards per page; the glow slider only ever touches these
+    _GLOW_FRAMES = {
+        "record": ("card_ctrl", "card_tips"),
+        "library": ("lib_left", "lib_right"),
+        "settings": ("set_wrap",),
+    }
+
     def _on_glow(self, _=None):
-        self.glow_var.set(int(round(self.glow_slider.get())))
+        lvl = int(round(self.glow_slider.get()))
+        # the slider reports every motion event, not just step changes
+        if lvl == int(self.glow_var.get()):
+            return
+        self.glow_var.set(lvl)
+        # repaint once the drag settles; the value is saved on release
+        if self._glow_job is not None:
+            self.after_cancel(self._glow_job)
+        self._glow_job = self.after(120, self._apply_glow_now)
+
+    def _apply_glow_now(self):
+        self._glow_job = None
+        for page in self._built_panels:
+            for attr in self._GLOW_FRAMES[page]:
+                self.apply_glow(getattr(self, attr), True)
+
+    def _on_glow_release(self, _=None):
+        if self._glow_job is not None:
+            self.after_cancel(self._glow_job)
+            self._apply_glow_now()
         self.persist_settings()
-        self.apply_style()
 
     def apply_glow(self, frame: ctk.CTkFrame, active: bool = True):
         lvl = int(self.glow_var.get())
@@ -1518,7 +2551,10 @@ class SaonixApp(ctk.CTk):
         self.h_title.configure(text_color=s["text"])
         self.h_status.configure(text_color=s["muted"])
 
-        # record
+        for page in self._built_panels:
+            self._page_parts[page][2](s)
+
+    def _style_record(self, s: Dict[str, str]):
         self.card_ctrl.configure(fg_color=s["card"])
         self.card_tips.configure(fg_color=s["card"])
         self.apply_glow(self.card_ctrl, True)
@@ -1541,7 +2577,7 @@ class SaonixApp(ctk.CTk):
         self.log_box.configure(fg_color=s["panel"], text_color=s["text"])
         self.btn_clear_log.configure(fg_color=s["panel"], hover_color=s["border"], text_color=s["text"], border_width=2, border_color=s["accent2"])
 
-        # library
+    def _style_library(self, s: Dict[str, str]):
         self.lib_left.configure(fg_color=s["card"])
         self.lib_right.configure(fg_color=s["card"])
         self.apply_glow(self.lib_left, True)
@@ -1566,7 +2602,9 @@ class SaonixApp(ctk.CTk):
         self.btn_play_sel.configure(fg_color=s["panel"], hover_color=s["border"], text_color=s["text"], border_width=2, border_color=s["accent"])
         self.btn_stop_sel.configure(fg_color=s["danger"], hover_color=s["danger"], text_color="#ffffff")
 
-        # settings
+        self._restyle_macro_buttons()
+
+    def _style_settings(self, s: Dict[str, str]):
         self.set_wrap.configure(fg_color=s["card"])
         self.apply_glow(self.set_wrap, True)
         self.set_title.configure(text_color=s["text"])
@@ -1585,104 +2623,123 @@ class SaonixApp(ctk.CTk):
         self.btn_reset.configure(fg_color=s["panel"], hover_color=s["border"], text_color=s["text"], border_width=2, border_color=s["accent2"])
         self.btn_apply_hotkeys.configure(fg_color=s["panel"], hover_color=s["border"], text_color=s["text"], border_width=2, border_color=s["accent2"])
 
-        self._restyle_macro_buttons()
-
     # ---------------------------
     # Texts
     # ---------------------------
     def apply_texts(self):
-        self.lbl_brand.configure(text=self.i18n.t("app_title"))
-        self.btn_record.configure(text=self.i18n.t("nav_record"))
-        self.btn_library.configure(text=self.i18n.t("nav_library"))
-        self.btn_settings.configure(text=self.i18n.t("nav_settings"))
+        s = self.i18n.snapshot(self._UI_KEYS)
+
+        _set_text(self.lbl_brand, s["app_title"])
+        _set_text(self.btn_record, s["nav_record"])
+        _set_text(self.btn_library, s["nav_library"])
+        _set_text(self.btn_settings, s["nav_settings"])
 
-        self.lbl_style.configure(text=self.i18n.t("style"))
-        self.lbl_mode.configure(text=self.i18n.t("theme"))
-        self.lbl_lang.configure(text=self.i18n.t("language"))
-        self.lbl_glow.configure(text=self.i18n.t("glow"))
+        _set_text(self.lbl_style, s["style"])
+        _set_text(self.lbl_mode, s["theme"])
+        _set_text(self.lbl_lang, s["language"])
+        _set_text(self.lbl_glow, s["glow"])
 
-        self.support_title.configure(text=self.i18n.t("support"))
-        self.support_text.configure(text=self.i18n.t("support_text"))
+        _set_text(self.support_title, s["support"])
+        _set_text(self.support_text, s["support_text"])
 
         if self._active_page == "record":
-            self.h_title.configure(text=self.i18n.t("page_record"))
+            _set_text(self.h_title, s["page_record"])
         elif self._active_page == "library":
-            self.h_title.configure(text=self.i18n.t("page_library"))
+            _set_text(self.h_title, s["page_library"])
         else:
-            self.h_title.configure(text=self.i18n.t("page_settings"))
-
-        # record
-        self.rec_title.configure(text=self.i18n.t("rec_controls"))
-        self.btn_start.configure(text=self.i18n.t("rec_start"))
-        self.btn_stop.configure(text=self.i18n.t("rec_stop"))
-        self.btn_play.configure(text=self.i18n.t("rec_play_loaded"))
-        self.btn_stopplay.configure(text=self.i18n.t("rec_stop_play"))
-        self.save_label.configure(text=self.i18n.t("rec_save_label"))
-        self.btn_save.configure(text=self.i18n.t("rec_save_btn"))
-        self.log_title.configure(text="Log")
-        self.btn_clear_log.configure(text=self.i18n.t("rec_clear_log"))
-        self.tips_title.configure(text=self.i18n.t("rec_tips"))
-
-        # library
-        self.lib_title.configure(text=self.i18n.t("lib_title"))
-        self.search_entry.configure(placeholder_text=self.i18n.t("search_ph"))
-        self.btn_load.configure(text=self.i18n.t("btn_load"))
-        self.btn_delete.configure(text=self.i18n.t("btn_delete"))
-        self.btn_rename.configure(text=self.i18n.t("btn_rename"))
-        self.btn_clone.configure(text=self.i18n.t("btn_clone"))
-        self.btn_export.configure(text=self.i18n.t("btn_export"))
-        self.btn_import.configure(text=self.i18n.t("btn_import"))
-        self.bind_label.configure(text=self.i18n.t("bind"))
-        self.bind_entry.configure(placeholder_text=self.i18n.t("bind_ph"))
-        self.btn_bind.configure(text=self.i18n.t("bind_set"))
-        self.btn_unbind.configure(text=self.i18n.t("bind_remove"))
-        self.btn_play_sel.configure(text=self.i18n.t("play_selected"))
-        self.btn_stop_sel.configure(text=self.i18n.t("rec_stop_play"))
-
-        # settings
-        self.set_title.configure(text=self.i18n.t("settings_playback"))
-        self.btn_apply.configure(text=self.i18n.t("apply"))
-        self.btn_reset.configure(text=self.i18n.t("reset"))
-        self.hk_title.configure(text=self.i18n.t("base_hotkeys"))
-        self.btn_apply_hotkeys.configure(text=self.i18n.t("hk_apply"))
-
-        self.set_labels[0].configure(text=self.i18n.t("repeat"))
-        self.set_labels[1].configure(text=self.i18n.t("loop"))
-        self.set_labels[2].configure(text=self.i18n.t("speed"))
-        self.set_labels[3].configure(text=self.i18n.t("delay"))
-
-        self.hk_labels[0].configure(text=self.i18n.t("hk_rec"))
-        self.hk_labels[1].configure(text=self.i18n.t("hk_stoprec"))
-        self.hk_labels[2].configure(text=self.i18n.t("hk_play"))
-        self.hk_labels[3].configure(text=self.i18n.t("hk_stop"))
+            _set_text(self.h_title, s["page_settings"])
+
+        for page in self._built_panels:
+            self._page_parts[page][1](s)
+
+        # resolved once per language for _apply_status()
+        self._status_texts = {"recording": s["status_recording"], "playing": s["status_playing"],
+                              "ready": s["status_ready"]}
+        self._last_status = None
+        self._apply_status(self._status)
+
+    def _texts_record(self, s: Dict[str, str]):
+        _set_text(self.rec_title, s["rec_controls"])
+        _set_text(self.btn_start, s["rec_start"])
+        _set_text(self.btn_stop, s["rec_stop"])
+        _set_text(self.btn_play, s["rec_play_loaded"])
+        _set_text(self.btn_stopplay, s["rec_stop_play"])
+        _set_text(self.save_label, s["rec_save_label"])
+        _set_text(self.btn_save, s["rec_save_btn"])
+        _set_text(self.log_title, "Log")
+        _set_text(self.btn_clear_log, s["rec_clear_log"])
+        _set_text(self.tips_title, s["rec_tips"])
+
+        self.update_tip_text(force=True)
+
+    def _texts_library(self, s: Dict[str, str]):
+        _set_text(self.lib_title, s["lib_title"])
+        self.search_entry.configure(placeholder_text=s["search_ph"])
+        _set_text(self.btn_load, s["btn_load"])
+        _set_text(self.btn_delete, s["btn_delete"])
+        _set_text(self.btn_rename, s["btn_rename"])
+        _set_text(self.btn_clone, s["btn_clone"])
+        _set_text(self.btn_export, s["btn_export"])
+        _set_text(self.btn_import, s["btn_import"])
+        _set_text(self.bind_label, s["bind"])
+        self.bind_entry.configure(placeholder_text=s["bind_ph"])
+        _set_text(self.btn_bind, s["bind_set"])
+        _set_text(self.btn_unbind, s["bind_remove"])
+        _set_text(self.btn_play_sel, s["play_selected"])
+        _set_text(self.btn_stop_sel, s["rec_stop_play"])
 
         self.refresh_binds_box()
         self.refresh_library()
         self.preview_selected()
-        self.update_tip_text(force=True)
+
+    def _texts_settings(self, s: Dict[str, str]):
+        _set_text(self.set_title, s["settings_playback"])
+        _set_text(self.btn_apply, s["apply"])
+        _set_text(self.btn_reset, s["reset"])
+        _set_text(self.hk_title, s["base_hotkeys"])
+        _set_text(self.btn_apply_hotkeys, s["hk_apply"])
+
+        _set_text(self.set_labels[0], s["repeat"])
+        _set_text(self.set_labels[1], s["loop"])
+        _set_text(self.set_labels[2], s["speed"])
+        _set_text(self.set_labels[3], s["delay"])
+
+        _set_text(self.hk_labels[0], s["hk_rec"])
+        _set_text(self.hk_labels[1], s["hk_stoprec"])
+        _set_text(self.hk_labels[2], s["hk_play"])
+        _set_text(self.hk_labels[3], s["hk_stop"])
 
     # ---------------------------
     # Navigation (no animation)
     # ---------------------------
+    def _ensure_page(self, which: str):
+        if which in self._built_panels:
+            return
+        build, texts, style = self._page_parts[which]
+        build()
+        self._built_panels.add(which)
+        texts(self.i18n.snapshot(self._UI_KEYS))
+        style(style_get(self.current_style))
+
     def show_page(self, which: str):
+        if which not in self._page_parts:
+            which = "settings"
+        self._ensure_page(which)
         self._active_page = which
         for p in (self.page_record, self.page_library, self.page_settings):
             p.grid_remove()
 
         if which == "record":
             self.page_record.grid()
-            self.h_title.configure(text=self.i18n.t("page_record"))
+            _set_text(self.h_title, self.i18n.t("page_record"))
         elif which == "library":
             self.page_library.grid()
-            self.h_title.configure(text=self.i18n.t("page_library"))
+            _set_text(self.h_title, self.i18n.t("page_library"))
         else:
             self.page_settings.grid()
-            self.h_title.configure(text=self.i18n.t("page_settings"))
+            _set_text(self.h_title, self.i18n.t("page_settings"))
 
-        # Remove full style refresh to speed up tab switching
-        # Only update navigation button styles (already done by apply_style elsewhere)
-        # But we need to ensure the active button is highlighted
-        s = style_get(self.current_style)
+        # only the nav highlight changes on a switch; pages are styled when built
         self._style_nav_button(self.btn_record, self._active_page == "record")
         self._style_nav_button(self.btn_library, self._active_page == "library")
         self._style_nav_button(self.btn_settings, self._active_page == "settings")
@@ -1752,6 +2809,8 @@ class SaonixApp(ctk.CTk):
                      else "Loop запускает на N секунд (Repeat игнорируется)."),
         ]
         self._tip_i = 0
+        # the one pending rotation; _texts_record restarts it (update_tip_text(force=True))
+        self._tip_job = None
 
         self.log_title = ctk.CTkLabel(self.page_record, text="Log", font=ctk.CTkFont(size=14, weight="bold"))
         self.log_title.grid(row=1, column=0, columnspan=2, sticky="w", padx=16, pady=(6, 6))
@@ -1762,20 +2821,15 @@ class SaonixApp(ctk.CTk):
         self.btn_clear_log = ctk.CTkButton(self.page_record, text="Clear", command=self.clear_log_ui)
         self.btn_clear_log.grid(row=3, column=0, columnspan=2, sticky="ew", padx=16, pady=(0, 16))
 
-        self.after(1200, self.update_tip_text)
-
     def update_tip_text(self, force: bool = False):
-        if not self._tips:
-            return
         if force:
+            # a language switch restarts the rotation; don't leave a second chain running
             self._tip_i = 0
-        try:
-            txt = self._tips[self._tip_i % len(self._tips)]()
-            self.tips_text.configure(text=txt)
-            self._tip_i += 1
-        except Exception:
-            pass
-        self.after(4500, self.update_tip_text)
+            if self._tip_job is not None:
+                self.after_cancel(self._tip_job)
+        _set_text(self.tips_text, self._tips[self._tip_i % len(self._tips)]())
+        self._tip_i += 1
+        self._tip_job = self.after(4500, self.update_tip_text)
 
     def clear_log_ui(self):
         try:
@@ -1800,7 +2854,7 @@ class SaonixApp(ctk.CTk):
                 return
 
         settings = self.current_play_settings()
-        events = [asdict(e) for e in self.engine.events]
+        events = self.engine.events
         self.db.put(name, events, settings)
         log.info(f"{self.i18n.t('saved')}: {name} (events: {len(events)})")
         self.refresh_library()
@@ -1825,7 +2879,10 @@ class SaonixApp(ctk.CTk):
         self.search_var = ctk.StringVar(value="")
         self.search_entry = ctk.CTkEntry(self.lib_left, textvariable=self.search_var, placeholder_text="Search…")
         self.search_entry.grid(row=1, column=0, padx=16, pady=(0, 10), sticky="ew")
-        self.search_entry.bind("<KeyRelease>", lambda e: self.refresh_library())
+        # typing refreshes the list once the keys settle, not per keystroke
+        self._search_job: Optional[str] = None
+        self._search_q = ""
+        self.search_entry.bind("<KeyRelease>", self._on_search_key)
 
         self.macros_scroll = ctk.CTkScrollableFrame(self.lib_left, corner_radius=14)
         self.macros_scroll.grid(row=3, column=0, padx=16, pady=(0, 10), sticky="nsew")
@@ -1905,10 +2962,9 @@ class SaonixApp(ctk.CTk):
         self.btn_stop_sel = ctk.CTkButton(playbar, text="Stop", command=self.engine.stop_playing)
         self.btn_stop_sel.grid(row=0, column=1, padx=6, sticky="ew")
 
-        self.refresh_library()
-        self.refresh_binds_box()
-
     def refresh_binds_box(self):
+        if "library" not in self._built_panels:
+            return
         self.binds_box.delete("1.0", "end")
         binds = self.db.binds()
         if not binds:
@@ -1917,43 +2973,92 @@ class SaonixApp(ctk.CTk):
         for hk, mn in sorted(binds.items(), key=lambda x: x[0]):
             self.binds_box.insert("end", f"{hk}  ->  {mn}\n")
 
-    def refresh_library(self):
-        q = self.search_var.get().strip().lower()
+    def _on_search_key(self, _=None):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        # arrows, Shift, Home... release keys too; only a changed query needs a refresh
+        if self.search_var.get().strip().lower() == self._search_q:
+            return
+        self._search_job = self.after(150, self._run_search)
 
-        for child in self.macros_scroll.winfo_children():
-            try: child.destroy()
-            except Exception: pass
-        self.macro_buttons.clear()
+    def _run_search(self):
+        self._search_job = None
+        self.refresh_library()
 
-        names = [n for n in self.db.names() if (not q or q in n.lower())]
+    def refresh_library(self):
+        if "library" not in self._built_panels:
+            return
+        q = self._search_q = self.search_var.get().strip().lower()
+        names = self.db.search(q)
+
+        # update the list in place: buttons leaving the view go to the pool, entering names
+        # reuse pooled buttons. Both lists follow db.names() order, so buttons that stay never
+        # need repacking; new ones are packed next to their neighbour.
+        shown = self.macro_buttons
+        keep = set(names)
+        for n in [n for n in shown if n not in keep]:
+            btn = shown.pop(n)
+            btn.pack_forget()
+            self._lib_pool.append(btn)
+
+        first_old = next((shown[n] for n in names if n in shown), None)
+        added = []
+        prev = None
+        for n in names:
+            btn = shown.get(n)
+            if btn is None:
+                # partial binds the name directly; no closure cell per button
+                cmd = functools.partial(self.select_macro, n)
+                if self._lib_pool:
+                    btn = self._lib_pool.pop()
+                    btn.configure(text=n, command=cmd)
+                else:
+                    btn = ctk.CTkButton(self.macros_scroll, text=n, anchor="w",
+                                        corner_radius=12, command=cmd)
+                if prev is not None:
+                    btn.pack(fill="x", padx=6, pady=6, after=prev)
+                elif first_old is not None:
+                    btn.pack(fill="x", padx=6, pady=6, before=first_old)
+                else:
+                    btn.pack(fill="x", padx=6, pady=6)
+                shown[n] = btn
+                added.append(n)
+            prev = btn
 
         if not names:
-            empty = ctk.CTkLabel(self.macros_scroll, text=self.i18n.t("empty"))
-            empty.pack(anchor="w", padx=8, pady=8)
+            if self._lib_empty is None:
+                self._lib_empty = ctk.CTkLabel(self.macros_scroll, text="")
+            _set_text(self._lib_empty, self.i18n.t("empty"))
+            self._lib_empty.pack(anchor="w", padx=8, pady=8)
             self.selected_macro = None
             self.preview_clear()
             return
+        if self._lib_empty is not None:
+            self._lib_empty.pack_forget()
 
-        if self.selected_macro not in names:
+        old_sel = self.selected_macro
+        if old_sel not in names:
             self.selected_macro = names[0]
 
-        for n in names:
-            btn = ctk.CTkButton(self.macros_scroll, text=n, anchor="w",
-                                corner_radius=12, command=lambda name=n: self.select_macro(name))
-            btn.pack(fill="x", padx=6, pady=6)
-            self.macro_buttons[n] = btn
-
-        self._restyle_macro_buttons()
+        s = style_get(self.current_style)
+        for n in {*added, old_sel, self.selected_macro}:
+            btn = shown.get(n)
+            if btn is not None:
+                self._style_macro_button(n, btn, s)
         self.preview_selected()
 
+    def _style_macro_button(self, name: str, btn: ctk.CTkButton, s: Dict[str, str]):
+        if name == self.selected_macro:
+            btn.configure(fg_color=s["panel"], hover_color=s["border"], text_color=s["text"],
+                          border_width=2, border_color=s["accent"])
+        else:
+            btn.configure(fg_color=s["card"], hover_color=s["border"], text_color=s["text"], border_width=0)
+
     def _restyle_macro_buttons(self):
         s = style_get(self.current_style)
         for name, btn in self.macro_buttons.items():
-            if name == self.selected_macro:
-                btn.configure(fg_color=s["panel"], hover_color=s["border"], text_color=s["text"],
-                              border_width=2, border_color=s["accent"])
-            else:
-                btn.configure(fg_color=s["card"], hover_color=s["border"], text_color=s["text"], border_width=0)
+            self._style_macro_button(name, btn, s)
 
     def select_macro(self, name: str):
         self.selected_macro = name
@@ -1961,9 +3066,18 @@ class SaonixApp(ctk.CTk):
         self.preview_selected()
 
     def preview_clear(self):
-        self.preview_title.configure(text="—")
-        self.preview_meta.configure(text="—")
-        self.preview_box.delete("1.0", "end")
+        _set_text(self.preview_title, "—")
+        _set_text(self.preview_meta, "—")
+        self._set_preview_text("")
+
+    def _set_preview_text(self, text: str):
+        # delete+insert re-lays-out the whole textbox; reading it back is a cheap Tcl call
+        box = self.preview_box
+        if box.get("1.0", "end-1c") == text:
+            return
+        box.delete("1.0", "end")
+        if text:
+            box.insert("end", text)
 
     def preview_selected(self):
         name = self.selected_macro
@@ -1977,17 +3091,25 @@ class SaonixApp(ctk.CTk):
 
         created = item.get("created", 0)
         created_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created)) if created else "—"
-        count = len(item.get("events", []))
+        count = self.db.event_count(name)
         st = item.get("settings", {})
         if self.i18n.lang == "ru":
             meta = f"Создан: {created_str} | Событий: {count} | repeat={st.get('repeat',1)} loop={st.get('loop_seconds',0)} speed={st.get('speed',1.0)}"
         else:
             meta = f"Created: {created_str} | Events: {count} | repeat={st.get('repeat',1)} loop={st.get('loop_seconds',0)} speed={st.get('speed',1.0)}"
 
-        self.preview_title.configure(text=name)
-        self.preview_meta.configure(text=meta)
-        self.preview_box.delete("1.0", "end")
-        self.preview_box.insert("end", json.dumps(st, ensure_ascii=False, indent=2))
+        _set_text(self.preview_title, name)
+        _set_text(self.preview_meta, meta)
+        self._set_preview_text(json.dumps(st, ensure_ascii=False, indent=2))
+
+    def _load_macro_events(self, name: str):
+        src = self._events_src
+        rev = self.db.revision(name)
+        if (src is not None and src[0] == name and src[1] == rev
+                and self.engine.events is src[2]):
+            return
+        self.engine.events = [Event(*row) for row in self.db.event_rows(name)]
+        self._events_src = (name, rev, self.engine.events)
 
     def load_selected(self):
         name = self.selected_macro
@@ -1997,7 +3119,7 @@ class SaonixApp(ctk.CTk):
         item = self.db.get(name)
         if not item:
             return
-        self.engine.events = [Event(**e) for e in item.get("events", [])]
+        self._load_macro_events(name)
         self.apply_play_settings_to_ui(item.get("settings", {}))
         log.info(f"{self.i18n.t('loaded')}: {name} (events: {len(self.engine.events)})")
         self.show_page("record")
@@ -2010,7 +3132,7 @@ class SaonixApp(ctk.CTk):
         item = self.db.get(name)
         if not item:
             return
-        self.engine.events = [Event(**e) for e in item.get("events", [])]
+        self._load_macro_events(name)
         self.apply_play_settings_to_ui(item.get("settings", {}))
         s = self.current_play_settings()
         self.engine.play(s["repeat"], s["loop_seconds"], s["speed"], s["start_delay"])
@@ -2133,44 +3255,40 @@ class SaonixApp(ctk.CTk):
         if not path:
             return
 
-        try:
-            payload = {
-                "format": "saonix_macro_v1",
-                "name": name,
-                "created": item.get("created", int(time.time())),
-                "settings": item.get("settings", {}),
-                "events": item.get("events", []),
-            }
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
-            log.info(f"{self.i18n.t('exported')}: {name} -> {path}")
-        except Exception as e:
-            log.error(f"Export error: {e}")
-            messagebox.showerror(self.i18n.t("app_title"), f"Error: {e}")
+        payload = {
+            "format": "saonix_macro_v1",
+            "name": name,
+            "created": item.get("created", int(time.time())),
+            "settings": item.get("settings", {}),
+            "events": self.db.get_events(name),
+        }
+
+        def write():
+            _atomic_write_json(path, payload)
+
+        def done(fut: Future):
+            try:
+                fut.result()
+                log.info(f"{self.i18n.t('exported')}: {name} -> {path}")
+            except Exception as e:
+                log.error(f"Export error: {e}")
+                messagebox.showerror(self.i18n.t("app_title"), f"Error: {e}")
+
+        self._when_done(self._io.submit(write), done)
 
     def import_macro(self):
         path = filedialog.askopenfilename(title=self.i18n.t("btn_import"), filetypes=[("JSON", "*.json")])
         if not path:
             return
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+
+        def read():
+            with open(path, "rb") as f:
+                payload = _json_loads(f.read())
             if not isinstance(payload, dict) or "events" not in payload:
                 raise ValueError("Invalid file")
 
-            name = str(payload.get("name", os.path.splitext(os.path.basename(path))[0])).strip() or "Imported macro"
-            if self.db.exists(name):
-                base = name
-                i = 2
-                while self.db.exists(f"{base} ({i})"):
-                    i += 1
-                name = f"{base} ({i})"
-
-            settings = payload.get("settings", {})
-            events = payload.get("events", [])
-
             ev_objs: List[Event] = []
-            for e in events:
+            for e in payload.get("events", []):
                 if not isinstance(e, dict):
                     continue
                 if not all(k in e for k in ("t", "device", "type", "data")):
@@ -2181,15 +3299,38 @@ class SaonixApp(ctk.CTk):
                     type=str(e["type"]),
                     data=dict(e["data"]) if isinstance(e["data"], dict) else {}
                 ))
+            return payload, ev_objs
 
-            self.db.put(name, [asdict(x) for x in ev_objs], settings if isinstance(settings, dict) else {})
-            log.info(f"{self.i18n.t('imported')}: {name} (events: {len(ev_objs)})")
-            self.selected_macro = name
-            self.refresh_library()
-        except Exception as e:
-            log.error(f"Import error: {e}")
-            log.error(traceback.format_exc())
-            messagebox.showerror(self.i18n.t("app_title"), f"Error: {e}")
+        def done(fut: Future):
+            try:
+                payload, ev_objs = fut.result()
+                name = str(payload.get("name", os.path.splitext(os.path.basename(path))[0])).strip() or "Imported macro"
+                if self.db.exists(name):
+                    base = name
+                    i = 2
+                    while self.db.exists(f"{base} ({i})"):
+                        i += 1
+                    name = f"{base} ({i})"
+
+                settings = payload.get("settings", {})
+                self.db.put(name, ev_objs, settings if isinstance(settings, dict) else {})
+                log.info(f"{self.i18n.t('imported')}: {name} (events: {len(ev_objs)})")
+                self.selected_macro = name
+                self.refresh_library()
+            except Exception as e:
+                log.error(f"Import error: {e}")
+                log.error(traceback.format_exc())
+                messagebox.showerror(self.i18n.t("app_title"), f"Error: {e}")
+
+        self._when_done(self._io.submit(read), done)
+
+    def _when_done(self, fut: Future, cb: Callable[[Future], None]):
+        # Tk is single-threaded: poll the future from the event loop rather than calling back
+        # from the worker
+        if fut.done():
+            cb(fut)
+        else:
+            self.after(30, self._when_done, fut, cb)
 
     def bind_selected(self):
         name = self.selected_macro
@@ -2355,7 +3496,7 @@ class SaonixApp(ctk.CTk):
                     if not item:
                         log.warn(f"[bind] macro not found: {name}")
                         return
-                    self.engine.events = [Event(**e) for e in item.get("events", [])]
+                    self._load_macro_events(name)
                     self.apply_play_settings_to_ui(item.get("settings", {}))
                     s = self.current_play_settings()
                     self.engine.play(s["repeat"], s["loop_seconds"], s["speed"], s["start_delay"])
@@ -2364,6 +3505,12 @@ class SaonixApp(ctk.CTk):
 
             base[hk] = make_play()
 
+        # HotkeyManager.set restarts the global hook; skip it when nothing changed. Bind
+        # callbacks look the macro up by name, so hotkeys + binds fully describe the mapping.
+        sig = (tuple(base), binds)
+        if sig == self._hk_sig:
+            return
+        self._hk_sig = sig
         self.hk.set(base)
 
 
@@ -2371,8 +3518,8 @@ class SaonixApp(ctk.CTk):
 # Run app
 # ============================================================
 
-def run_app():
-    app = SaonixApp()
+def run_app(update_fut: Optional[Future] = None):
+    app = SaonixApp(update_fut)
     app.mainloop()
 
 
@@ -2382,7 +3529,18 @@ def run_app():
 
 def main():
     # loader first; then app gfgd
-    l = Loader()
+    # icon + update check start before any Tk work so network latency overlaps window construction
+    progress_q: "queue.Queue[tuple]" = queue.Queue()
+
+    def progress_cb(p: float, msg: str):
+        progress_q.put(("p", p, msg))
+
+    progress_cb(0.02, "Preparing…")
+    # daemon threads: closing the window must not wait for a slow download
+    icon_fut = _run_daemon(_cached_download_with_meta, ICON_PNG_URL, CACHED_ICON_FILE, CACHED_ICON_META)
+    update_fut = _run_daemon(check_and_update, progress_cb)
+
+    l = Loader(progress_q, icon_fut, update_fut)
     l.mainloop()
 
 if __name__ == "__main__":